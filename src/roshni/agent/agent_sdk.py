@@ -84,7 +84,8 @@ def _build_mcp_server(tools: list[ToolDefinition]) -> Any:
         @tool(td.name, td.description, schema)
         async def _wrapper(args: dict[str, Any], _fn: Callable[..., str] = fn) -> dict[str, Any]:
             try:
-                result = _fn(**args)
+                # Tools are synchronous (file scans, HTTP); keep them off the SDK's event loop
+                result = await asyncio.to_thread(_fn, **args)
                 return {"content": [{"type": "text", "text": str(result)}]}
             except Exception as exc:
                 return {"content": [{"type": "text", "text": f"Error: {exc}"}]}
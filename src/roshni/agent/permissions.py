@@ -50,6 +50,11 @@ def get_domain_tier(
         return default
 
 
+def tier_allows(tier: PermissionTier, permission: str) -> bool:
+    """True if *tier* is high enough for tools with the given *permission* string."""
+    return _PERMISSION_MIN_TIER.get(permission, 3) <= tier
+
+
 def filter_tools_by_tier(
     tools: list[ToolDefinition],
     tier: PermissionTier,
@@ -62,8 +67,8 @@ def filter_tools_by_tier(
     """
     if tier == PermissionTier.NONE:
         return []
-    filtered = [t for t in tools if _PERMISSION_MIN_TIER.get(t.permission, 3) <= tier]
+    filtered = [t for t in tools if tier_allows(tier, t.permission)]
     for t in filtered:
-        if t.requires_approval is None and _PERMISSION_MIN_TIER.get(t.permission, 3) <= tier:
+        if t.requires_approval is None:
             t.requires_approval = False
     return filtered
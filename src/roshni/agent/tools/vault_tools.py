@@ -2,16 +2,57 @@
 
 from __future__ import annotations
 
+import bisect
 import os
 import re
+import tempfile
 import threading
-from datetime import datetime
+import time
+from collections import defaultdict
+from collections.abc import Callable
 
-from roshni.agent.permissions import PermissionTier, filter_tools_by_tier
+from roshni.agent.permissions import PermissionTier, filter_tools_by_tier, tier_allows
 from roshni.agent.tools import ToolDefinition
-from roshni.agent.vault import VaultManager
+from roshni.agent.vault import VaultManager, strip_embedded_data
 
-_vault_write_lock = threading.Lock()
+# directory -> (st_mtime_ns, sorted slugs)
+_SLUG_CACHE: dict[str, tuple[int, list[str]]] = {}
+
+# (epoch minute, "YYYY-MM-DD HH:MM") — replaced as a whole, so safe to share across threads
+_minute_stamp: tuple[int, str] = (-1, "")
+
+_path_locks: defaultdict[str, threading.Lock] = defaultdict(threading.Lock)
+_path_locks_guard = threading.Lock()
+
+
+def _path_lock(path: str) -> threading.Lock:
+    """Return the lock serializing read-modify-write cycles on one file."""
+    with _path_locks_guard:
+        return _path_locks[path]
+
+
+def _write_text(path: str, content: str) -> None:
+    """Atomic write: temp file + rename so readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _now_minute() -> str:
+    """Current local time as ``YYYY-MM-DD HH:MM``, formatted once per minute."""
+    global _minute_stamp
+    minute = int(time.time()) // 60
+    if _minute_stamp[0] != minute:
+        _minute_stamp = (minute, time.strftime("%Y-%m-%d %H:%M", time.localtime(minute * 60)))
+    return _minute_stamp[1]
 
 
 def _discover_entries(directory: str) -> list[tuple[str, str]]:
@@ -21,20 +62,21 @@ def _discover_entries(directory: str) -> list[tuple[str, str]]:
       - Flat:  directory/my-entry.md         → slug="my-entry"
       - Subdir: directory/my-entry/SKILL.md  → slug="my-entry" (any .md inside)
     """
-    if not os.path.isdir(directory):
+    try:
+        scan = os.scandir(directory)
+    except OSError:
         return []
     entries: list[tuple[str, str]] = []
-    for item in os.listdir(directory):
-        full = os.path.join(directory, item)
-        if item.endswith(".md") and os.path.isfile(full):
-            entries.append((item[:-3], full))
-        elif os.path.isdir(full):
-            # Look for a .md file inside the subdirectory
-            md_files = sorted(
-                f for f in os.listdir(full) if f.endswith(".md") and os.path.isfile(os.path.join(full, f))
-            )
-            if md_files:
-                entries.append((item, os.path.join(full, md_files[0])))
+    with scan:
+        for item in scan:
+            if item.name.endswith(".md") and item.is_file():
+                entries.append((item.name[:-3], item.path))
+            elif item.is_dir():
+                # Look for a .md file inside the subdirectory
+                with os.scandir(item.path) as sub:
+                    md_files = sorted(e.name for e in sub if e.name.endswith(".md") and e.is_file())
+                if md_files:
+                    entries.append((item.name, os.path.join(item.path, md_files[0])))
     return sorted(entries, key=lambda e: e[0])
 
 
@@ -65,36 +107,72 @@ def _get_frontmatter_field(path: str, key: str) -> str | None:
 
 
 def _update_frontmatter_field(content: str, key: str, value: str) -> str:
-    """Update or insert a frontmatter field in markdown content."""
-    pattern = rf'^({key}:\s*)"?[^"\n]+"?\s*$'
-    replacement = rf'\g<1>"{value}"'
-    updated, count = re.subn(pattern, replacement, content, count=1, flags=re.MULTILINE)
-    if count > 0:
-        return updated
-    # Insert before closing --- (skip the opening --- on line 1)
-    parts = content.split("---", 2)
-    if len(parts) >= 3:
-        return parts[0] + "---" + parts[1] + f'{key}: "{value}"\n---' + parts[2]
-    return content
+    """Update or insert a frontmatter field in markdown content.
 
-
-def _resolve_slug(directory: str, name: str) -> str | None:
-    """Resolve a name to an existing entry slug. Exact match first, then substring."""
-    entries = _discover_entries(directory)
-    if not entries:
-        return None
-    slug = name.lower().replace(" ", "-")
-    # Exact match
-    for entry_slug, _ in entries:
-        if entry_slug == slug:
-            return entry_slug
+    Only the leading ``---`` block is touched; the body is never scanned.
+    """
+    if not content.startswith("---"):
+        return content
+    end = content.find("\n---", 3)
+    if end < 0:
+        return content
+    line = f'{key}: "{value}"'
+    start = content.find(f"\n{key}:", 0, end)
+    if start < 0:
+        # Insert before the closing ---
+        return f"{content[:end]}\n{line}{content[end:]}"
+    start += 1
+    stop = content.find("\n", start, end)
+    if stop < 0:
+        stop = end
+    return content[:start] + line + content[stop:]
+
+
+def _cached_slugs(directory: str, *, rescan: bool = False) -> list[str]:
+    """Return the sorted entry slugs of *directory*, rescanning only when it changes.
+
+    Keyed on the directory's mtime, so a single stat replaces a full scan
+    for back-to-back lookups. Writers also drop the entry explicitly. The
+    mtime misses a ``.md`` added inside an existing entry subdirectory (or
+    within the filesystem's timestamp granularity), so callers that find
+    nothing should retry with *rescan*.
+    """
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        _SLUG_CACHE.pop(directory, None)
+        return []
+    cached = _SLUG_CACHE.get(directory)
+    if not rescan and cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    slugs = [slug for slug, _ in _discover_entries(directory)]
+    _SLUG_CACHE[directory] = (mtime_ns, slugs)
+    return slugs
+
+
+def _match_slug(slugs: list[str], slug: str) -> str | None:
+    """Exact match first, then prefix, then substring, over sorted *slugs*."""
+    # Exact match, else the first slug starting with the name (slugs are sorted)
+    i = bisect.bisect_left(slugs, slug)
+    if i < len(slugs) and slugs[i].startswith(slug):
+        return slugs[i]
     # Substring scan
-    for entry_slug, _ in entries:
+    for entry_slug in slugs:
         if slug in entry_slug:
             return entry_slug
     return None
 
 
+def _resolve_slug(directory: str, name: str) -> str | None:
+    """Resolve a name to an existing entry slug. Exact match first, then prefix, then substring."""
+    slug = name.lower().replace(" ", "-")
+    found = _match_slug(_cached_slugs(directory), slug)
+    if found is None:
+        # The cached listing may predate the entry; check the directory itself before reporting a miss
+        found = _match_slug(_cached_slugs(directory, rescan=True), slug)
+    return found
+
+
 def _resolve_path(directory: str, name: str) -> str | None:
     """Resolve a name to its file path. Supports flat files and subdirectories."""
     entries = _discover_entries(directory)
@@ -147,70 +225,106 @@ def _sanitize_slug(name: str) -> str:
     return slug or "untitled"
 
 
+def _format_fm_scalar(key: str, value: object) -> str:
+    return f'{key}: "{value}"'
+
+
+def _format_fm_list(key: str, value: object) -> str:
+    return f"{key}: {value}"
+
+
+# Frontmatter line formatters keyed by value type; anything unlisted is quoted.
+_FM_FORMATTERS = {list: _format_fm_list}
+
+
 def _save_md_file(directory: str, name: str, frontmatter: dict, body: str) -> str:
     """Save a .md file with YAML frontmatter."""
-    os.makedirs(directory, exist_ok=True)
-    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    now = _now_minute()
     if "created" not in frontmatter:
         frontmatter["created"] = now
     if "updated" not in frontmatter:
         frontmatter["updated"] = now
 
-    lines = ["---"]
-    for key, value in frontmatter.items():
-        if isinstance(value, list):
-            lines.append(f"{key}: {value}")
-        else:
-            lines.append(f'{key}: "{value}"')
-    lines.append("---")
-    lines.append(body)
-    content = "\n".join(lines) + "\n"
+    fm_text = "\n".join(
+        _FM_FORMATTERS.get(type(value), _format_fm_scalar)(key, value) for key, value in frontmatter.items()
+    )
+    content = f"---\n{fm_text}\n---\n{body}\n"
 
     slug = _sanitize_slug(name)
     path = os.path.join(directory, f"{slug}.md")
-    with _vault_write_lock:
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+    with _path_lock(path):
+        try:
+            _write_text(path, content)
+        except FileNotFoundError:
+            os.makedirs(directory, exist_ok=True)
+            _write_text(path, content)
+    _SLUG_CACHE.pop(directory, None)
     return f"Saved: {slug}.md"
 
 
 def _append_to_md_file(directory: str, slug: str, content: str) -> str:
     """Append a dated bullet to an existing .md file and update the 'updated' timestamp."""
     path = os.path.join(directory, f"{slug}.md")
-    now = datetime.now().strftime("%Y-%m-%d %H:%M")
-    bullet_date = datetime.now().strftime("%Y-%m-%d")
+    now = _now_minute()
+    bullet_date = now[:10]
     bullet = f"\n- {bullet_date}: {content}\n"
 
-    with _vault_write_lock:
+    # Full atomic rewrite, not an in-place patch: readers and a crash only ever see
+    # the old file or the new one, and the lock orders this against saves.
+    with _path_lock(path):
         with open(path, encoding="utf-8") as f:
             existing = f.read()
         existing = _update_frontmatter_field(existing, "updated", now)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(existing.rstrip("\n") + "\n" + bullet)
+        _write_text(path, existing.rstrip("\n") + "\n" + bullet)
     return f"Appended to: {slug}.md"
 
 
+def _preview(content: str, pos: int, width: int = 200) -> str:
+    """Return a *width*-char window of *content* starting a little before *pos*."""
+    start = max(0, pos - 50)
+    end = start + width
+    preview = content[start:end]
+    if start > 0:
+        preview = "..." + preview
+    if end < len(content):
+        preview += "..."
+    return preview
+
+
 def _search_md_files(directory: str, query: str, limit: int = 5) -> str:
     """Keyword search across .md files in a directory."""
     if not query:
         return "Please provide a search query."
-    if not os.path.isdir(directory):
+    try:
+        with os.scandir(directory) as scan:
+            md_entries = sorted((e for e in scan if e.name.endswith(".md") and e.is_file()), key=lambda e: e.name)
+    except OSError:
         return "No entries found."
 
-    query_lower = query.lower()
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+    # ASCII queries are matched by lowercasing ASCII text and using find, which
+    # is far cheaper than an IGNORECASE scan. Non-matching files are rejected
+    # on the raw bytes (bytes.lower folds ASCII only) and never decoded.
+    needle = query.lower() if query.isascii() else None
+    byte_needle = needle.encode() if needle is not None else None
     results: list[str] = []
-    for fname in sorted(os.listdir(directory)):
-        if not fname.endswith(".md"):
-            continue
-        path = os.path.join(directory, fname)
+    for entry in md_entries:
+        fname, path = entry.name, entry.path
         try:
-            with open(path, encoding="utf-8") as f:
-                content = f.read()
+            with open(path, "rb") as f:
+                data = f.read()
+            if byte_needle is not None and byte_needle not in data.lower():
+                continue
+            content = strip_embedded_data(data.decode("utf-8"))
         except (OSError, UnicodeDecodeError):
             continue
-        if query_lower in content.lower():
-            preview = content[:200] + "..." if len(content) > 200 else content
-            results.append(f"**{fname[:-3]}**\n{preview}")
+        if needle is not None and content.isascii():
+            pos = content.lower().find(needle)
+        else:
+            m = pattern.search(content)
+            pos = m.start() if m else -1
+        if pos >= 0:
+            results.append(f"**{fname[:-3]}**\n{_preview(content, pos)}")
             if len(results) >= limit:
                 break
 
@@ -221,178 +335,225 @@ def create_vault_tools(
     vault: VaultManager,
     tier: PermissionTier = PermissionTier.INTERACT,
 ) -> list[ToolDefinition]:
-    """Create people/projects/ideas vault tools, filtered by permission tier."""
+    """Create people/projects/ideas vault tools, filtered by permission tier.
+
+    Each tool is built from an ordered ``(permission, factory)`` spec, and only
+    the factories whose permission *tier* allows are called.
+    """
+    if tier == PermissionTier.NONE:
+        return []
+
     people_dir = str(vault.people_dir)
     projects_dir = str(vault.projects_dir)
     ideas_dir = str(vault.ideas_dir)
 
-    tools: list[ToolDefinition] = [
+    # (permission, factory) in display order; factories run only for permissions the tier allows
+    specs: list[tuple[str, Callable[[], ToolDefinition]]] = [
         # -- People --
-        ToolDefinition(
-            name="list_people",
-            description="List all people in the vault.",
-            parameters={"type": "object", "properties": {}, "required": []},
-            function=lambda: _list_md_files(people_dir),
-            permission="read",
+        (
+            "read",
+            lambda: ToolDefinition(
+                name="list_people",
+                description="List all people in the vault.",
+                parameters={"type": "object", "properties": {}, "required": []},
+                function=lambda: _list_md_files(people_dir),
+                permission="read",
+            ),
         ),
-        ToolDefinition(
-            name="get_person",
-            description="Read a person's profile from the vault (supports partial name matching).",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Person name or partial match"},
+        (
+            "read",
+            lambda: ToolDefinition(
+                name="get_person",
+                description="Read a person's profile from the vault (supports partial name matching).",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "description": "Person name or partial match"},
+                    },
+                    "required": ["name"],
                 },
-                "required": ["name"],
-            },
-            function=lambda name: _read_md_file_fuzzy(people_dir, name),
-            permission="read",
+                function=lambda name: _read_md_file_fuzzy(people_dir, name),
+                permission="read",
+            ),
         ),
-        ToolDefinition(
-            name="save_person",
-            description="Create or append to a person's profile with name, tags, and notes.",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Person's full name"},
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Tags (e.g. colleague, friend)",
+        (
+            "write",
+            lambda: ToolDefinition(
+                name="save_person",
+                description="Create or append to a person's profile with name, tags, and notes.",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "description": "Person's full name"},
+                        "tags": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Tags (e.g. colleague, friend)",
+                        },
+                        "last_contact": {"type": "string", "description": "Last contact date (YYYY-MM-DD)"},
+                        "notes": {"type": "string", "description": "Notes about this person"},
                     },
-                    "last_contact": {"type": "string", "description": "Last contact date (YYYY-MM-DD)"},
-                    "notes": {"type": "string", "description": "Notes about this person"},
+                    "required": ["name", "notes"],
                 },
-                "required": ["name", "notes"],
-            },
-            function=lambda name, notes, tags=None, last_contact="": _save_person(
-                vault, name, notes, tags, last_contact
+                function=lambda name, notes, tags=None, last_contact="": _save_person(
+                    vault, name, notes, tags, last_contact
+                ),
+                permission="write",
             ),
-            permission="write",
         ),
-        ToolDefinition(
-            name="search_people",
-            description="Search people profiles by keyword.",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search keyword"},
+        (
+            "read",
+            lambda: ToolDefinition(
+                name="search_people",
+                description="Search people profiles by keyword.",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "query": {"type": "string", "description": "Search keyword"},
+                    },
+                    "required": ["query"],
                 },
-                "required": ["query"],
-            },
-            function=lambda query: _search_md_files(people_dir, query),
-            permission="read",
+                function=lambda query: _search_md_files(people_dir, query),
+                permission="read",
+            ),
         ),
         # -- Projects --
-        ToolDefinition(
-            name="list_projects",
-            description="List all projects in the vault.",
-            parameters={"type": "object", "properties": {}, "required": []},
-            function=lambda: _list_md_files(projects_dir),
-            permission="read",
+        (
+            "read",
+            lambda: ToolDefinition(
+                name="list_projects",
+                description="List all projects in the vault.",
+                parameters={"type": "object", "properties": {}, "required": []},
+                function=lambda: _list_md_files(projects_dir),
+                permission="read",
+            ),
         ),
-        ToolDefinition(
-            name="get_project",
-            description="Read a project's details from the vault (supports partial name matching).",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Project name or partial match"},
+        (
+            "read",
+            lambda: ToolDefinition(
+                name="get_project",
+                description="Read a project's details from the vault (supports partial name matching).",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "description": "Project name or partial match"},
+                    },
+                    "required": ["name"],
                 },
-                "required": ["name"],
-            },
-            function=lambda name: _read_md_file_fuzzy(projects_dir, name),
-            permission="read",
+                function=lambda name: _read_md_file_fuzzy(projects_dir, name),
+                permission="read",
+            ),
         ),
-        ToolDefinition(
-            name="save_project",
-            description="Create or append to a project with title, status, tags, and notes.",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Project title"},
-                    "status": {"type": "string", "description": "Status (active, paused, completed)"},
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Tags for the project",
+        (
+            "write",
+            lambda: ToolDefinition(
+                name="save_project",
+                description="Create or append to a project with title, status, tags, and notes.",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string", "description": "Project title"},
+                        "status": {"type": "string", "description": "Status (active, paused, completed)"},
+                        "tags": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Tags for the project",
+                        },
+                        "notes": {"type": "string", "description": "Project notes and details"},
                     },
-                    "notes": {"type": "string", "description": "Project notes and details"},
+                    "required": ["title", "notes"],
                 },
-                "required": ["title", "notes"],
-            },
-            function=lambda title, notes, status="active", tags=None: _save_project(vault, title, notes, status, tags),
-            permission="write",
+                function=lambda title, notes, status="active", tags=None: _save_project(
+                    vault, title, notes, status, tags
+                ),
+                permission="write",
+            ),
         ),
         # -- Ideas --
-        ToolDefinition(
-            name="list_ideas",
-            description="List all ideas in the vault.",
-            parameters={"type": "object", "properties": {}, "required": []},
-            function=lambda: _list_md_files(ideas_dir),
-            permission="read",
+        (
+            "read",
+            lambda: ToolDefinition(
+                name="list_ideas",
+                description="List all ideas in the vault.",
+                parameters={"type": "object", "properties": {}, "required": []},
+                function=lambda: _list_md_files(ideas_dir),
+                permission="read",
+            ),
         ),
-        ToolDefinition(
-            name="get_idea",
-            description="Read an idea's details from the vault (supports partial name matching).",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Idea name or partial match"},
+        (
+            "read",
+            lambda: ToolDefinition(
+                name="get_idea",
+                description="Read an idea's details from the vault (supports partial name matching).",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "description": "Idea name or partial match"},
+                    },
+                    "required": ["name"],
                 },
-                "required": ["name"],
-            },
-            function=lambda name: _read_md_file_fuzzy(ideas_dir, name),
-            permission="read",
+                function=lambda name: _read_md_file_fuzzy(ideas_dir, name),
+                permission="read",
+            ),
         ),
-        ToolDefinition(
-            name="save_idea",
-            description="Create or append to an idea with title, tags, and description.",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Idea title"},
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Tags for the idea",
+        (
+            "write",
+            lambda: ToolDefinition(
+                name="save_idea",
+                description="Create or append to an idea with title, tags, and description.",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string", "description": "Idea title"},
+                        "tags": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Tags for the idea",
+                        },
+                        "notes": {"type": "string", "description": "Idea description and details"},
                     },
-                    "notes": {"type": "string", "description": "Idea description and details"},
+                    "required": ["title", "notes"],
                 },
-                "required": ["title", "notes"],
-            },
-            function=lambda title, notes, tags=None: _save_idea(vault, title, notes, tags),
-            permission="write",
+                function=lambda title, notes, tags=None: _save_idea(vault, title, notes, tags),
+                permission="write",
+            ),
         ),
-        ToolDefinition(
-            name="search_ideas",
-            description="Search ideas by keyword.",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search keyword"},
+        (
+            "read",
+            lambda: ToolDefinition(
+                name="search_ideas",
+                description="Search ideas by keyword.",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "query": {"type": "string", "description": "Search keyword"},
+                    },
+                    "required": ["query"],
                 },
-                "required": ["query"],
-            },
-            function=lambda query: _search_md_files(ideas_dir, query),
-            permission="read",
+                function=lambda query: _search_md_files(ideas_dir, query),
+                permission="read",
+            ),
         ),
         # -- Cross-vault --
-        ToolDefinition(
-            name="search_vault_all",
-            description="Search across all vault sections (people, projects, ideas, etc.) by keyword.",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search keyword"},
-                    "limit": {"type": "integer", "description": "Max results (default 10)"},
+        (
+            "read",
+            lambda: ToolDefinition(
+                name="search_vault_all",
+                description="Search across all vault sections (people, projects, ideas, etc.) by keyword.",
+                parameters={
+                    "type": "object",
+                    "properties": {
+                        "query": {"type": "string", "description": "Search keyword"},
+                        "limit": {"type": "integer", "description": "Max results (default 10)"},
+                    },
+                    "required": ["query"],
                 },
-                "required": ["query"],
-            },
-            function=lambda query, limit=10: _search_vault_all(vault, query, limit),
-            permission="read",
+                function=lambda query, limit=10: _search_vault_all(vault, query, limit),
+                permission="read",
+            ),
         ),
     ]
+    tools = [factory() for permission, factory in specs if tier_allows(tier, permission)]
 
     return filter_tools_by_tier(tools, tier)
 
@@ -457,8 +618,4 @@ def _search_vault_all(vault: VaultManager, query: str, limit: int = 10) -> str:
     results = vault.search_all(query, limit=limit)
     if not results:
         return f"No results for '{query}'."
-    parts: list[str] = []
-    for r in results:
-        snippets_text = "\n".join(r["snippets"][:2])
-        parts.append(f"**[{r['section']}]** {r['path']}\n{snippets_text}")
-    return "\n\n---\n\n".join(parts)
+    return "\n\n---\n\n".join(f"**[{r.section}]** {r.path}\n" + "\n".join(r.snippets[:2]) for r in results)
@@ -2,9 +2,43 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import math
 import os
-from datetime import datetime
+import re
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
+from typing import TextIO
+
+from loguru import logger
+
+_SEARCH_CACHE_SIZE = 128
+
+# Search index snapshots live in the user's cache, not the (often synced) vault
+_DEFAULT_INDEX_DIR = "~/.roshni-data/cache/vault-index"
+
+
+@dataclass(slots=True, frozen=True)
+class SearchHit:
+    """A vault file matched by :meth:`VaultManager.search_all`."""
+
+    section: str
+    path: str  # relative to the agent directory
+    snippets: tuple[str, ...]
+
+    def __getitem__(self, key: str):
+        # Callers written against the old dict results still index by key
+        return getattr(self, key)
 
 
 class VaultManager:
@@ -20,54 +54,46 @@ class VaultManager:
             projects/   — Project overview .md files
             people/     — Person .md files with frontmatter
             admin/      — audit.md
+
+    The search index snapshot is kept outside the vault, under *index_dir*
+    (default ``~/.roshni-data/cache/vault-index``).
     """
 
     _SUBDIRS = ("persona", "memory", "tasks", "projects", "people", "ideas", "admin")
 
-    def __init__(self, vault_path: str | Path, agent_dir: str = "jarvis") -> None:
+    def __init__(self, vault_path: str | Path, agent_dir: str = "jarvis", index_dir: str | Path | None = None) -> None:
         self.vault_path = Path(vault_path).expanduser()
         self.agent_dir = agent_dir
 
-    # -- directory properties --------------------------------------------------
-
-    @property
-    def base_dir(self) -> Path:
-        return self.vault_path / self.agent_dir
-
-    @property
-    def persona_dir(self) -> Path:
-        return self.base_dir / "persona"
-
-    @property
-    def memory_dir(self) -> Path:
-        return self.base_dir / "memory"
-
-    @property
-    def tasks_dir(self) -> Path:
-        return self.base_dir / "tasks"
-
-    @property
-    def projects_dir(self) -> Path:
-        return self.base_dir / "projects"
-
-    @property
-    def people_dir(self) -> Path:
-        return self.base_dir / "people"
-
-    @property
-    def ideas_dir(self) -> Path:
-        return self.base_dir / "ideas"
-
-    @property
-    def admin_dir(self) -> Path:
-        return self.base_dir / "admin"
+        # Directories are fixed for the manager's lifetime; build the paths once
+        self.base_dir = self.vault_path / agent_dir
+        self.persona_dir = self.base_dir / "persona"
+        self.memory_dir = self.base_dir / "memory"
+        self.tasks_dir = self.base_dir / "tasks"
+        self.projects_dir = self.base_dir / "projects"
+        self.people_dir = self.base_dir / "people"
+        self.ideas_dir = self.base_dir / "ideas"
+        self.admin_dir = self.base_dir / "admin"
+        self._base_prefix = str(self.base_dir) + os.sep
+        self._section_paths = tuple((subdir, self._base_prefix + subdir) for subdir in self._SUBDIRS)
+
+        index_key = hashlib.sha256(str(self.base_dir.resolve()).encode()).hexdigest()[:16]
+        index_root = Path(index_dir or _DEFAULT_INDEX_DIR).expanduser()
+        self._index = _SearchIndex(index_root / f"{index_key}.json")
+        # (query_lower, limit) -> (index generation, hits), least recently used first
+        self._search_cache: OrderedDict[tuple[str, int], tuple[int, list[SearchHit]]] = OrderedDict()
+        # Tools call search_all from worker threads; the index and LRU are shared state
+        self._search_lock = threading.Lock()
+        self._audit_lock = threading.Lock()
+        self._audit_fh: TextIO | None = None
+        self._audit_finalizer: weakref.finalize | None = None
 
     # -- scaffold --------------------------------------------------------------
 
     def scaffold(self) -> None:
         """Create the full directory structure and starter files."""
-        for subdir in self._SUBDIRS:
-            (self.base_dir / subdir).mkdir(parents=True, exist_ok=True)
+        for _, section_path in self._section_paths:
+            os.makedirs(section_path, exist_ok=True)
 
         # tasks/_archive/
         (self.tasks_dir / "_archive").mkdir(exist_ok=True)
@@ -85,73 +111,474 @@ class VaultManager:
     # -- audit logging ---------------------------------------------------------
 
     def log_action(self, action: str, tool_name: str, details: str = "") -> None:
-        """Append a timestamped entry to admin/audit.md."""
-        self.admin_dir.mkdir(parents=True, exist_ok=True)
-        audit_path = self.admin_dir / "audit.md"
-        if not audit_path.exists():
-            audit_path.write_text("# Audit Log\n\n", encoding="utf-8")
+        """Append a timestamped entry to admin/audit.md.
 
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        entry = f"- `{timestamp}` **{action}** via `{tool_name}`"
+        The file is opened once and kept open; each entry is one flushed
+        write, so the log stays current for readers and survives a crash.
+        If audit.md was deleted, rotated or replaced since it was opened
+        (by sync or by hand), it is reopened so no entry lands in a stale file.
+        """
+        ts = _now_second()
         if details:
-            entry += f" — {details}"
-        entry += "\n"
-
-        with open(audit_path, "a", encoding="utf-8") as f:
-            f.write(entry)
+            entry = f"- `{ts}` **{action}** via `{tool_name}` — {details}\n"
+        else:
+            entry = f"- `{ts}` **{action}** via `{tool_name}`\n"
+
+        with self._audit_lock:
+            if self._audit_fh is not None and not self._audit_fh_current():
+                if self._audit_finalizer is not None:
+                    self._audit_finalizer()
+                self._audit_fh = None
+            if self._audit_fh is None:
+                self._audit_fh = self._open_audit_log()
+                self._audit_finalizer = weakref.finalize(self, self._audit_fh.close)
+            self._audit_fh.write(entry)
+            self._audit_fh.flush()
+
+    def close(self) -> None:
+        """Close the audit log handle and save pending search index changes. Safe to call more than once."""
+        with self._search_lock:
+            self._index.flush()
+        with self._audit_lock:
+            if self._audit_finalizer is not None:
+                self._audit_finalizer()
+            self._audit_fh = None
+            self._audit_finalizer = None
+
+    def _audit_fh_current(self) -> bool:
+        """True if the open audit handle is still the file at admin/audit.md."""
+        assert self._audit_fh is not None
+        try:
+            on_disk = os.stat(self.admin_dir / "audit.md")
+        except OSError:
+            return False
+        st = os.fstat(self._audit_fh.fileno())
+        return (st.st_dev, st.st_ino) == (on_disk.st_dev, on_disk.st_ino)
+
+    def _open_audit_log(self) -> TextIO:
+        audit_path = self.admin_dir / "audit.md"
+        try:
+            fh = open(audit_path, "x", encoding="utf-8")
+        except FileExistsError:
+            return open(audit_path, "a", encoding="utf-8")
+        except FileNotFoundError:
+            self.admin_dir.mkdir(parents=True, exist_ok=True)
+            return self._open_audit_log()
+        fh.write("# Audit Log\n\n")
+        return fh
 
     # -- cross-section search --------------------------------------------------
 
-    def search_all(self, query: str, limit: int = 10) -> list[dict]:
+    def search_all(self, query: str, limit: int = 10) -> list[SearchHit]:
         """Keyword search across all vault markdown files.
 
-        Returns a list of dicts with keys: section, path, snippets.
+        A single-term query is matched as a substring. A multi-word query is
+        matched term-by-term in one pass per file, and files are ranked by the
+        number of distinct terms they contain.
+
+        Results are cached per (query, limit) until any vault file changes.
+        Safe to call from several threads; searches are serialized.
+
+        Returns a list of :class:`SearchHit`.
         """
-        if not query:
+        if not query or limit <= 0:
             return []
 
-        query_lower = query.lower()
-        results: list[dict] = []
+        with self._search_lock:
+            return self._search_locked(query, limit)
 
-        for subdir in self._SUBDIRS:
-            section_dir = self.base_dir / subdir
-            if not section_dir.is_dir():
+    def _search_locked(self, query: str, limit: int) -> list[SearchHit]:
+        query_lower = query.lower()
+        files = self._index.refresh(self._iter_md_files())
+        key = (query_lower, limit)
+        cached = self._search_cache.get(key)
+        if cached is not None and cached[0] == self._index.generation:
+            self._search_cache.move_to_end(key)
+            return list(cached[1])
+
+        terms = _query_terms(query)
+        if len(terms) > 1:
+            results = self._search_terms(files, terms, limit)
+        else:
+            results = self._search_term(files, query_lower, limit)
+
+        self._search_cache[key] = (self._index.generation, results)
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return list(results)
+
+    def _search_term(self, files: list[tuple[str, str]], query_lower: str, limit: int) -> list[SearchHit]:
+        """Return files containing *query_lower* as a substring, in walk order."""
+        pattern = _term_matcher((query_lower,))
+        results: list[SearchHit] = []
+
+        candidates = self._index.candidates(query_lower)
+        for subdir, fpath in files:
+            if candidates is not None and fpath not in candidates:
+                continue
+            content = _read_text(fpath)
+            if content is None:
+                continue
+            offsets = _match_offsets(content, query_lower, pattern)
+            first = next(offsets, None)
+            if first is None:
                 continue
-            for root, _dirs, files in os.walk(section_dir):
-                for fname in files:
-                    if not fname.endswith(".md"):
-                        continue
-                    fpath = Path(root) / fname
-                    try:
-                        content = fpath.read_text(encoding="utf-8")
-                    except (OSError, UnicodeDecodeError):
-                        continue
-                    if query_lower not in content.lower():
-                        continue
-
-                    snippets = _extract_snippets(content, query_lower)
-                    results.append(
-                        {
-                            "section": subdir,
-                            "path": str(fpath.relative_to(self.base_dir)),
-                            "snippets": snippets,
-                        }
-                    )
-                    if len(results) >= limit:
-                        return results
+
+            snippets = _extract_snippets(content, chain((first,), offsets))
+            results.append(SearchHit(subdir, fpath.removeprefix(self._base_prefix), snippets))
+            if len(results) >= limit:
+                return results
 
         return results
 
+    def _search_terms(self, files: list[tuple[str, str]], terms: tuple[str, ...], limit: int) -> list[SearchHit]:
+        """Rank vault files by how many distinct query terms each contains."""
+        matcher = _term_matcher(terms)
+        scored: list[tuple[int, SearchHit]] = []
+
+        candidates: set[str] = set()
+        unindexed = False
+        for term in terms:
+            term_paths = self._index.candidates(term)
+            if term_paths is None:
+                unindexed = True
+                break
+            candidates |= term_paths
+
+        if not unindexed:
+            files = [(subdir, fpath) for subdir, fpath in files if fpath in candidates]
+        texts = _read_texts([fpath for _, fpath in files])
+        for (subdir, fpath), content in zip(files, texts, strict=True):
+            if content is None:
+                continue
+            # Checked per term: one alternation scan can't see overlapping terms ("robot" in "robotics")
+            lowered = content.lower()
+            hits = sum(1 for term in terms if term in lowered)
+            if not hits:
+                continue
+            snippets = _extract_snippets(content, (m.start() for m in matcher.finditer(content)))
+            scored.append((hits, SearchHit(subdir, fpath.removeprefix(self._base_prefix), snippets)))
 
-def _extract_snippets(content: str, query_lower: str, max_snippets: int = 3) -> list[str]:
-    """Extract lines containing the query with one line of context each side."""
-    lines = content.split("\n")
-    snippets: list[str] = []
-    for i, line in enumerate(lines):
-        if query_lower in line.lower():
-            start = max(0, i - 1)
-            end = min(len(lines), i + 2)
-            snippets.append("\n".join(lines[start:end]).strip())
-            if len(snippets) >= max_snippets:
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [result for _, result in scored[:limit]]
+
+    def _iter_md_files(self) -> Iterator[tuple[str, str]]:
+        """Yield (section, path) for every markdown file under the vault sections."""
+        for subdir, section_path in self._section_paths:
+            for path in _walk_md(section_path):
+                yield subdir, path
+
+
+def _walk_md(root: str) -> Iterator[str]:
+    """Yield paths of ``.md`` files under *root*, depth-first in os.walk order.
+
+    Uses ``os.scandir`` directly: entry types come from readdir, nothing is
+    stat'ed, and non-markdown entries never become path objects.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        files: list[str] = []
+        subdirs: list[str] = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(".md"):
+                        files.append(entry.path)
+        except OSError:
+            continue
+        yield from files
+        stack.extend(reversed(subdirs))
+
+
+_second_stamp: tuple[int, str] = (-1, "")
+
+
+def _now_second() -> str:
+    """Current local time as ``YYYY-MM-DD HH:MM:SS``, formatted once per second."""
+    global _second_stamp
+    second = int(time.time())
+    if _second_stamp[0] != second:
+        _second_stamp = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+    return _second_stamp[1]
+
+
+_DATA_URI_RE = re.compile(r"data:[\w.+-]+/[\w.+-]+;base64,[A-Za-z0-9+/=]+")
+
+
+def strip_embedded_data(content: str) -> str:
+    """Remove inline base64 data URIs (pasted images etc.) from markdown text.
+
+    They can dwarf the prose of a note and only add noise to search matches
+    and previews.
+    """
+    if "base64," not in content:
+        return content
+    return _DATA_URI_RE.sub("", content)
+
+
+_WORD_RE = re.compile(r"\w+")
+
+# Bump when the snapshot layout changes; older snapshots are rebuilt
+_INDEX_VERSION = 4
+
+# Index changes are saved at most this often (seconds); close() saves the rest
+_INDEX_SAVE_INTERVAL = 30.0
+
+
+class _SearchIndex:
+    """Word index of every vault markdown file, revalidated by mtime and saved as JSON.
+
+    Each file's lowercased word set feeds a word -> paths map, so finding
+    candidate files for a query scans the vocabulary rather than every file;
+    only the candidates' text is then read. A fresh process loads the
+    snapshot and re-indexes only the files whose (mtime, size) changed since
+    it was written, instead of reading the whole vault on its first search.
+
+    The snapshot holds paths, (mtime, size) and the postings, never note
+    text. It is plain JSON, so a tampered or corrupt file can't run code;
+    anything malformed is a cold start.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        # path -> (mtime_ns, size, lowercased words)
+        self._files: dict[str, tuple[int, int, frozenset[str]]] | None = None
+        self._postings: dict[str, set[str]] = {}
+        # Bumped whenever the indexed set of files or their text changes
+        self.generation = 0
+        self._unsaved = False
+        self._saved_at = -math.inf
+
+    def refresh(self, files: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+        """Return the (section, path) pairs of *files* that could be read, re-indexing only changed ones."""
+        if self._files is None:
+            self._files = self._load()
+            for key, entry in self._files.items():
+                self._post(key, entry[2])
+        indexed = self._files
+        dirty = False
+        listed: list[tuple[str, str]] = []
+        stale: list[tuple[str, os.stat_result]] = []
+
+        for section, key in files:
+            try:
+                st = os.stat(key)
+            except OSError:
+                continue
+            cached = indexed.get(key)
+            if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+                stale.append((key, st))
+            listed.append((section, key))
+
+        if stale:
+            texts = _read_texts([key for key, _ in stale])
+            for (key, st), text in zip(stale, texts, strict=True):
+                old = indexed.pop(key, None)
+                if old is not None:
+                    self._unpost(key, old[2])
+                if text is None:
+                    continue
+                words = frozenset(_WORD_RE.findall(text.lower()))
+                indexed[key] = (st.st_mtime_ns, st.st_size, words)
+                self._post(key, words)
+            dirty = True
+
+        out = [(section, key) for section, key in listed if key in indexed]  # drops unreadable files
+        for key in indexed.keys() - {key for _, key in out}:
+            self._unpost(key, indexed.pop(key)[2])
+            dirty = True
+        if dirty:
+            self.generation += 1
+            self._unsaved = True
+        if self._unsaved and time.monotonic() - self._saved_at >= _INDEX_SAVE_INTERVAL:
+            self.flush()
+        return out
+
+    def flush(self) -> None:
+        """Save the snapshot if the index changed since it was last saved."""
+        if self._unsaved:
+            self._save()
+            self._unsaved = False
+            self._saved_at = time.monotonic()
+
+    def candidates(self, term_lower: str) -> set[str] | None:
+        """Paths whose text may contain *term_lower*, or None if the index can't tell.
+
+        Each run of word characters in the term can only occur inside a word
+        of the text, so a file must contain, for every run, some word that
+        includes it. For a term that is a single run this is the exact file
+        set; with punctuation it is a superset the caller still verifies.
+        Call after :meth:`refresh`.
+        """
+        runs = _WORD_RE.findall(term_lower)
+        if not runs:
+            return None
+        result: set[str] | None = None
+        for run in dict.fromkeys(runs):
+            paths: set[str] = set()
+            for word, posting in self._postings.items():
+                if run in word:
+                    paths |= posting
+            result = paths if result is None else result & paths
+            if not result:
                 break
-    return snippets
+        return result
+
+    def _post(self, key: str, words: frozenset[str]) -> None:
+        for word in words:
+            self._postings.setdefault(word, set()).add(key)
+
+    def _unpost(self, key: str, words: frozenset[str]) -> None:
+        for word in words:
+            posting = self._postings.get(word)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[word]
+
+    def _load(self) -> dict[str, tuple[int, int, frozenset[str]]]:
+        try:
+            with open(self.path, "rb") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, RecursionError) as e:
+            logger.warning(f"Discarding unreadable vault search index {self.path}: {e}")
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return {}
+        try:
+            paths = data["paths"]
+            stats = data["files"]
+            if not (isinstance(paths, list) and isinstance(stats, list) and len(paths) == len(stats)):
+                raise TypeError("paths and files must be parallel lists")
+            words: list[set[str]] = [set() for _ in paths]
+            for word, ids in data["postings"].items():
+                for i in ids:
+                    if not isinstance(i, int) or i < 0:
+                        raise TypeError(f"bad path id {i!r}")
+                    words[i].add(word)
+            loaded: dict[str, tuple[int, int, frozenset[str]]] = {}
+            for key, (mtime_ns, size), key_words in zip(paths, stats, words, strict=True):
+                if not (isinstance(key, str) and isinstance(mtime_ns, int) and isinstance(size, int)):
+                    raise TypeError(f"bad entry for {key!r}")
+                loaded[key] = (mtime_ns, size, frozenset(key_words))
+        except (KeyError, IndexError, AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"Discarding malformed vault search index {self.path}: {e}")
+            return {}
+        return loaded
+
+    def _save(self) -> None:
+        assert self._files is not None
+        ids = {key: i for i, key in enumerate(self._files)}
+        snapshot = {
+            "version": _INDEX_VERSION,
+            "paths": list(ids),
+            "files": [[mtime_ns, size] for mtime_ns, size, _ in self._files.values()],
+            "postings": {word: [ids[key] for key in keys] for word, keys in self._postings.items()},
+        }
+        try:
+            try:
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            except FileNotFoundError:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to save vault search index {self.path}: {e}")
+
+
+# Below this many changed files, thread start-up costs more than it overlaps
+_PARALLEL_READ_MIN = 8
+
+
+def _read_text(path: str) -> str | None:
+    """Read a vault file for indexing or searching, or None if it can't be read as UTF-8."""
+    try:
+        # Unbuffered whole-file read: FileIO.readall sizes one read from fstat
+        with open(path, "rb", buffering=0) as f:
+            return strip_embedded_data(f.read().decode("utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _read_texts(paths: list[str]) -> list[str | None]:
+    """Read *paths* in order, overlapping the reads on a thread pool when there are many."""
+    if len(paths) < _PARALLEL_READ_MIN:
+        return [_read_text(p) for p in paths]
+    workers = min(32, len(paths), (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="roshni-vault-read") as pool:
+        return list(pool.map(_read_text, paths))
+
+
+def _query_terms(query: str) -> tuple[str, ...]:
+    """Split a query into distinct lowercased terms, preserving order."""
+    return tuple(dict.fromkeys(query.lower().split()))
+
+
+@lru_cache(maxsize=64)
+def _term_matcher(terms: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile query terms into one case-insensitive alternation.
+
+    A file is scanned once for all terms, in place — no lowercased copy of
+    the text. Longer terms come first so a term that prefixes another
+    doesn't shadow it.
+    """
+    return re.compile("|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+
+
+def _match_offsets(content: str, needle: str, pattern: re.Pattern[str]) -> Iterator[int]:
+    """Yield the start offset of each case-insensitive match of *needle*, in order.
+
+    When both sides are ASCII, lowercasing keeps offsets aligned, so a plain
+    ``str.find`` loop over the lowered text replaces the much slower
+    IGNORECASE regex scan. Anything else goes through *pattern*.
+    """
+    if not (needle.isascii() and content.isascii()):
+        for m in pattern.finditer(content):
+            yield m.start()
+        return
+    haystack = content.lower()
+    pos = haystack.find(needle)
+    while pos >= 0:
+        yield pos
+        pos = haystack.find(needle, pos + len(needle))
+
+
+def _extract_snippets(content: str, offsets: Iterable[int], max_snippets: int = 3) -> tuple[str, ...]:
+    """Cut the matched line plus one line of context each side around each offset.
+
+    Works on the text in place with find/rfind. Offsets must be ascending;
+    further matches on an already-used line are skipped.
+    """
+    snippets: list[str] = []
+    used_until = -1
+    for off in offsets:
+        if off <= used_until:
+            continue
+        line_start = content.rfind("\n", 0, off) + 1
+        line_end = content.find("\n", off)
+        if line_end < 0:
+            line_end = len(content)
+        ctx_start = content.rfind("\n", 0, line_start - 1) + 1 if line_start > 0 else 0
+        ctx_end = content.find("\n", line_end + 1) if line_end < len(content) else -1
+        if ctx_end < 0:
+            ctx_end = len(content)
+        snippets.append(content[ctx_start:ctx_end].strip())
+        used_until = line_end
+        if len(snippets) >= max_snippets:
+            break
+    return tuple(snippets)
@@ -5,32 +5,55 @@ and Obsidian rendering. The event log (events.ndjson) is the recovery
 source of truth; checkpoint.json is a derived snapshot.
 
 Crash semantics:
-1. Every state change is first appended to events.ndjson (fsync'd)
-2. checkpoint() writes a full snapshot via atomic temp-file + rename
-3. On resume(), replay events with seq > checkpoint.last_event_seq
+1. Every state change is first appended to events.ndjson; fsyncs are
+   group-committed within a short window and forced before each checkpoint
+2. checkpoint() writes a full snapshot via atomic temp-file + rename, then
+   appends only the changed fields to checkpoint.delta.ndjson (fsync'd)
+   until the deltas are compacted into a new snapshot
+3. On resume(), load the snapshot, apply its deltas, then replay events
+   with seq > checkpoint.last_event_seq
 4. If checkpoint is missing/corrupt, rebuild entirely from events
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
 import re
 import tempfile
+import weakref
+from bisect import bisect_right
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import pairwise
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
 from loguru import logger
 
-from .events import CONFLICT_DETECTED
+from .events import (
+    BUDGET_RECORDED_CALL,
+    CONFLICT_DETECTED,
+    PHASE_COMPLETED,
+    PHASE_FAILED,
+    PHASE_STARTED,
+    PLAN_WRITTEN,
+    PROJECT_TRANSITIONED,
+)
 from .models import (
+    JournalEntry,
     Phase,
     PhaseStatus,
     Project,
     ProjectStatus,
     WorkflowEvent,
+    _journal_entry_to_dict,
+    _now_iso,
     compute_plan_hash,
     project_from_dict,
     project_to_dict,
@@ -75,11 +98,23 @@ class WorkflowBackend(Protocol):
 
 _PLAN_OVERRIDE_START = "<!-- ROSHNI:PLAN-OVERRIDE-START -->"
 _PLAN_OVERRIDE_END = "<!-- ROSHNI:PLAN-OVERRIDE-END -->"
+_FRONTMATTER_HEAD_BYTES = 4096
+# Frontmatter lines that change on every render; they alone don't warrant a rewrite
+_OBSIDIAN_VOLATILE_RE = re.compile(r"^(?:last_orchestrator_update_at|updated): .*\n", re.MULTILINE)
+_OBSIDIAN_FRONTMATTER_RE = re.compile(r"\A---\n(.*?)\n---", re.DOTALL)
+
+_PHASE_STATUS_ICONS = {
+    PhaseStatus.PENDING: " ",
+    PhaseStatus.ACTIVE: "~",
+    PhaseStatus.COMPLETED: "x",
+    PhaseStatus.FAILED: "!",
+    PhaseStatus.SKIPPED: "-",
+}
 
 
 def render_obsidian(project: Project, projects_dir: str) -> str:
     """Render a project to Obsidian markdown with YAML frontmatter."""
-    now = datetime.now().isoformat(timespec="seconds")
+    now = _now_iso()
     lines = [
         "---",
         f"id: {project.id}",
@@ -104,13 +139,7 @@ def render_obsidian(project: Project, projects_dir: str) -> str:
         lines.append("## Phases")
         lines.append("")
         for phase in project.phases:
-            status_icon = {
-                PhaseStatus.PENDING: " ",
-                PhaseStatus.ACTIVE: "~",
-                PhaseStatus.COMPLETED: "x",
-                PhaseStatus.FAILED: "!",
-                PhaseStatus.SKIPPED: "-",
-            }.get(phase.status, " ")
+            status_icon = _PHASE_STATUS_ICONS.get(phase.status, " ")
             lines.append(f"### [{status_icon}] {phase.name}")
             if phase.description:
                 lines.append(f"{phase.description}")
@@ -118,47 +147,41 @@ def render_obsidian(project: Project, projects_dir: str) -> str:
 
             if phase.entry_criteria:
                 lines.append("**Entry criteria:**")
-                for ec in phase.entry_criteria:
-                    check = "x" if ec.met else " "
-                    lines.append(f"- [{check}] {ec.description}")
+                lines.extend(f"- [{'x' if ec.met else ' '}] {ec.description}" for ec in phase.entry_criteria)
                 lines.append("")
 
             if phase.tasks:
                 lines.append("**Tasks:**")
-                for task in phase.tasks:
-                    lines.append(f"- `{task.id}`: {task.description}")
+                lines.extend(f"- `{task.id}`: {task.description}" for task in phase.tasks)
                 lines.append("")
 
             if phase.exit_criteria:
                 lines.append("**Exit criteria:**")
-                for ec in phase.exit_criteria:
-                    check = "x" if ec.met else " "
-                    lines.append(f"- [{check}] {ec.description}")
+                lines.extend(f"- [{'x' if ec.met else ' '}] {ec.description}" for ec in phase.exit_criteria)
                 lines.append("")
 
     # Terminal conditions
     if project.terminal_conditions:
         lines.append("## Terminal Conditions")
         lines.append("")
-        for tc in project.terminal_conditions:
-            check = "x" if tc.met else " "
-            lines.append(f"- [{check}] {tc.description} ({tc.type})")
+        lines.extend(f"- [{'x' if tc.met else ' '}] {tc.description} ({tc.type})" for tc in project.terminal_conditions)
         lines.append("")
 
     # Recent journal (last 10)
     if project.journal:
         lines.append("## Journal (recent)")
         lines.append("")
-        for entry in project.journal[-10:]:
-            lines.append(f"- **{entry.timestamp}** [{entry.actor}] {entry.action}: {entry.content}")
+        lines.extend(
+            f"- **{entry.timestamp}** [{entry.actor}] {entry.action}: {entry.content}"
+            for entry in project.journal[-10:]
+        )
         lines.append("")
 
     # Artifacts
     if project.artifacts:
         lines.append("## Artifacts")
         lines.append("")
-        for artifact in project.artifacts:
-            lines.append(f"- [{artifact.name}]({artifact.path}) ({artifact.mime_type})")
+        lines.extend(f"- [{artifact.name}]({artifact.path}) ({artifact.mime_type})" for artifact in project.artifacts)
         lines.append("")
 
     return "\n".join(lines)
@@ -168,15 +191,45 @@ def parse_obsidian_frontmatter(text: str) -> dict[str, Any]:
     """Extract YAML frontmatter from an Obsidian markdown file."""
     import yaml
 
-    m = re.match(r"\A---\n(.*?)\n---", text, re.DOTALL)
+    m = _OBSIDIAN_FRONTMATTER_RE.match(text)
     if not m:
         return {}
+    # libyaml's C loader when PyYAML was built with it; same safe schema
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        return yaml.safe_load(m.group(1)) or {}
+        return yaml.load(m.group(1), Loader=loader) or {}
     except Exception:
         return {}
 
 
+@lru_cache(maxsize=256)
+def _iso_to_epoch(stamp: str) -> float | None:
+    """Parse a (naive, local) ISO 8601 timestamp to epoch seconds; None if invalid."""
+    try:
+        return datetime.fromisoformat(stamp).timestamp()
+    except (ValueError, TypeError):
+        return None
+
+
+def _read_frontmatter_block(path: Path) -> str:
+    """Return the leading ``---`` frontmatter block of *path*, or "" if it has none.
+
+    Only the first few KiB are read when the block closes within them; the
+    body of a long note is never loaded just to compare frontmatter fields.
+    """
+    with open(path, "rb") as f:
+        head = f.read(_FRONTMATTER_HEAD_BYTES)
+        if not head.startswith(b"---\n"):
+            return ""
+        end = head.find(b"\n---", 4)
+        if end < 0:
+            head += f.read()
+            end = head.find(b"\n---", 4)
+            if end < 0:
+                return ""
+    return head[: end + 4].decode("utf-8")
+
+
 def check_obsidian_conflict(
     obsidian_path: Path,
     checkpoint_plan_hash: str,
@@ -190,27 +243,25 @@ def check_obsidian_conflict(
     - mtime changed but plan_hash same -> cosmetic edit, no conflict
     - mtime changed and plan_hash different -> real conflict
     """
-    if not obsidian_path.exists():
-        return None
-
     if not last_update_at:
         return None
 
-    # Check mtime
-    file_mtime = datetime.fromtimestamp(obsidian_path.stat().st_mtime)
+    # Check mtime, as plain epoch seconds
     try:
-        last_update = datetime.fromisoformat(last_update_at)
-    except (ValueError, TypeError):
+        file_mtime = obsidian_path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    last_update = _iso_to_epoch(last_update_at)
+    if last_update is None:
         return None
 
     # Allow 2-second tolerance for filesystem timestamp granularity
-    if (file_mtime - last_update).total_seconds() <= 2.0:
+    if file_mtime - last_update <= 2.0:
         return None
 
     # mtime changed — check if plan_hash changed too
     try:
-        text = obsidian_path.read_text(encoding="utf-8")
-        fm = parse_obsidian_frontmatter(text)
+        fm = parse_obsidian_frontmatter(_read_frontmatter_block(obsidian_path))
         obs_plan_hash = fm.get("plan_hash", "")
         obs_status = fm.get("status", "")
 
@@ -235,6 +286,73 @@ def check_obsidian_conflict(
 _FRONTMATTER_RE = re.compile(r"\A---\n(.*?)\n---\n?(.*)", re.DOTALL)
 
 
+# One shared compact encoder: json.dumps(..., ensure_ascii=False) builds a new one per call
+_EVENT_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# Compact separators keep the stdlib's C encoder; indent=2 falls back to the
+# pure-Python one, which is several times slower on a full snapshot.
+_SNAPSHOT_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str, separators=(",", ":"))
+
+# A checkpoint delta log is folded into a fresh full snapshot after this many lines,
+# or once it outgrows the snapshot itself
+_DELTA_COMPACT_LINES = 32
+
+
+@dataclass
+class _SnapshotState:
+    """What this backend last wrote to a project's checkpoint files."""
+
+    snapshot_id: str
+    fields: dict[str, str]  # top-level key -> encoded JSON, journal excluded
+    journal_len: int
+    file_id: tuple[int, int] | None  # _stat_id() of checkpoint.json as written
+    snapshot_bytes: int
+    delta_lines: int = 0
+    delta_bytes: int = 0
+
+
+# Appends only need their data (and the new length) on disk; fdatasync skips the
+# mtime-only inode update that fsync also forces. Not available on macOS.
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+# Appended events are fsync'd together at most this long after the first unsynced write
+_EVENT_FSYNC_DELAY = 0.01
+
+
+def _close_event_fds(fds: dict[str, int], unsynced: dict[str, asyncio.AbstractEventLoop]) -> None:
+    """fsync pending appends and close every open event-log descriptor."""
+    for project_id, fd in fds.items():
+        try:
+            if project_id in unsynced:
+                _datasync(fd)
+        except OSError as e:
+            logger.warning(f"Failed to sync event log for {project_id}: {e}")
+        finally:
+            os.close(fd)
+    fds.clear()
+    unsynced.clear()
+
+
+def _stat_id(path: Path) -> tuple[int, int] | None:
+    """(inode, mtime_ns) identifying a file's current version, or None if it's missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns
+
+
+def _line_seq(line: bytes) -> int | None:
+    """The integer ``seq`` of one raw event-log line, or None if it's blank, torn or malformed."""
+    if not line.strip():
+        return None
+    try:
+        seq = json.loads(line).get("seq")
+    except (ValueError, AttributeError):
+        return None
+    return seq if isinstance(seq, int) else None
+
+
 def _slugify(text: str) -> str:
     """Convert text to a filename-safe slug."""
     slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
@@ -249,6 +367,7 @@ class FileWorkflowBackend:
         {base_dir}/{project_id}/
             plan.json           # Canonical plan
             checkpoint.json     # Full snapshot (derived)
+            checkpoint.delta.ndjson  # Changed fields since the snapshot
             events.ndjson       # Append-only event log
             worker-logs/        # Per-worker JSONL
             llm-calls/          # LLM request/response records
@@ -259,32 +378,46 @@ class FileWorkflowBackend:
         self._base = Path(base_dir)
         self._obsidian_dir = Path(obsidian_projects_dir) if obsidian_projects_dir else None
         self._seq_counters: dict[str, int] = {}  # project_id -> next seq
+        self._ensured_dirs: set[str] = set()  # projects whose workspace dirs exist
+        # Long-lived O_APPEND descriptors for events.ndjson, and projects with unsynced
+        # appends -> the event loop their pending fsync timer was scheduled on
+        self._event_fds: dict[str, int] = {}
+        self._unsynced: dict[str, asyncio.AbstractEventLoop] = {}
+        # project_id -> (journal entries already encoded, their JSON), in journal order
+        self._journal_json: dict[str, tuple[list[JournalEntry], list[str]]] = {}
+        self._snapshots: dict[str, _SnapshotState] = {}
+        # project_id -> (fingerprint of the rendered note minus timestamps, _stat_id() after writing)
+        self._obsidian_written: dict[str, tuple[bytes, tuple[int, int] | None]] = {}
+        self._fds_finalizer = weakref.finalize(self, _close_event_fds, self._event_fds, self._unsynced)
 
     def _project_dir(self, project_id: str) -> Path:
         return self._base / project_id
 
     def _ensure_dirs(self, project_id: str) -> Path:
-        """Create workspace directories for a project."""
+        """Create workspace directories for a project, once per backend."""
         project_dir = self._project_dir(project_id)
+        if project_id in self._ensured_dirs:
+            return project_dir
         for sub in ("worker-logs", "llm-calls", "artifacts"):
             (project_dir / sub).mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs.add(project_id)
         return project_dir
 
+    def forget_workspace(self, project_id: str) -> None:
+        """Drop cached state for a workspace that was removed or moved on disk."""
+        self._ensured_dirs.discard(project_id)
+        self._snapshots.pop(project_id, None)
+        self._obsidian_written.pop(project_id, None)
+        fd = self._event_fds.pop(project_id, None)
+        self._unsynced.pop(project_id, None)
+        if fd is not None:
+            os.close(fd)
+
     def _next_seq(self, project_id: str) -> int:
         """Get the next monotonic sequence number for a project."""
         if project_id not in self._seq_counters:
-            # Initialize from event log
-            events_path = self._project_dir(project_id) / "events.ndjson"
-            max_seq = 0
-            if events_path.exists():
-                for line in events_path.read_text().splitlines():
-                    if line.strip():
-                        try:
-                            evt = json.loads(line)
-                            max_seq = max(max_seq, evt.get("seq", 0))
-                        except json.JSONDecodeError:
-                            continue
-            self._seq_counters[project_id] = max_seq
+            # Initialize from the tail of the event log
+            self._seq_counters[project_id] = self._last_event_seq(self._project_dir(project_id) / "events.ndjson")
         self._seq_counters[project_id] += 1
         return self._seq_counters[project_id]
 
@@ -298,15 +431,18 @@ class FileWorkflowBackend:
             event_id=self._format_event_id(seq),
             seq=seq,
             type=event_type,
-            timestamp=datetime.now().isoformat(timespec="seconds"),
+            timestamp=_now_iso(),
             actor=actor,
             payload=payload or {},
         )
 
     async def record_event(self, project_id: str, event: WorkflowEvent) -> None:
-        """Append event to NDJSON log with fsync."""
-        project_dir = self._ensure_dirs(project_id)
-        events_path = project_dir / "events.ndjson"
+        """Append event to the NDJSON log; the fsync is group-committed.
+
+        The line is written immediately, so readers see it at once. Appends
+        made within ``_EVENT_FSYNC_DELAY`` share one fsync; call
+        :meth:`sync_events` for an explicit durability barrier.
+        """
         event_dict = {
             "event_id": event.event_id,
             "seq": event.seq,
@@ -315,13 +451,47 @@ class FileWorkflowBackend:
             "actor": event.actor,
             "payload": event.payload,
         }
-        line = json.dumps(event_dict, ensure_ascii=False) + "\n"
+        line = (_EVENT_ENCODER.encode(event_dict) + "\n").encode("utf-8")
+        os.write(self._event_fd(project_id), line)
+        loop = asyncio.get_running_loop()
+        # A timer left on another loop (e.g. a finished asyncio.run) may never fire; schedule one here
+        if self._unsynced.get(project_id) is not loop:
+            self._unsynced[project_id] = loop
+            loop.call_later(_EVENT_FSYNC_DELAY, self.sync_events, project_id)
+
+    def sync_events(self, project_id: str) -> None:
+        """fsync any appended-but-unsynced events for *project_id*."""
+        if self._unsynced.pop(project_id, None) is None:
+            return
+        fd = self._event_fds.get(project_id)
+        if fd is not None:
+            _datasync(fd)
+
+    def close(self) -> None:
+        """Sync and close all event-log descriptors. Safe to call more than once."""
+        _close_event_fds(self._event_fds, self._unsynced)
+
+    async def __aenter__(self) -> FileWorkflowBackend:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _event_fd(self, project_id: str) -> int:
+        """Return the open append descriptor for a project's events.ndjson.
+
+        Reopened if the workspace was deleted underneath it, so appends
+        never go to an unlinked file.
+        """
+        fd = self._event_fds.get(project_id)
+        if fd is not None:
+            if os.fstat(fd).st_nlink:
+                return fd
+            self.forget_workspace(project_id)
+        events_path = self._ensure_dirs(project_id) / "events.ndjson"
         fd = os.open(str(events_path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
-        try:
-            os.write(fd, line.encode("utf-8"))
-            os.fsync(fd)
-        finally:
-            os.close(fd)
+        self._event_fds[project_id] = fd
+        return fd
 
     async def record_llm_call(self, project_id: str, call_record: dict) -> None:
         """Write an LLM call record to the llm-calls directory."""
@@ -334,7 +504,7 @@ class FileWorkflowBackend:
         path.write_text(json.dumps(call_record, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
 
     async def save_plan(self, project: Project) -> None:
-        """Write the canonical plan.json."""
+        """Write the canonical plan.json and set ``project.plan_hash`` to match it."""
         project_dir = self._ensure_dirs(project.id)
         plan_path = project_dir / "plan.json"
 
@@ -379,6 +549,8 @@ class FileWorkflowBackend:
 
     async def checkpoint(self, project: Project) -> None:
         """Write a full project snapshot (atomic write)."""
+        # The snapshot's last_event_seq must never be ahead of the durable log
+        self.sync_events(project.id)
         project_dir = self._ensure_dirs(project.id)
         checkpoint_path = project_dir / "checkpoint.json"
 
@@ -390,24 +562,111 @@ class FileWorkflowBackend:
             except (ValueError, TypeError):
                 pass
 
-        project.updated = datetime.now().isoformat(timespec="seconds")
+        project.updated = _now_iso()
         project.last_orchestrator_update_at = project.updated
 
-        data = project_to_dict(project)
-        self._atomic_write(checkpoint_path, json.dumps(data, indent=2, ensure_ascii=False, default=str))
+        self._write_checkpoint(project, checkpoint_path)
 
         # Re-render Obsidian file ONLY for workflow-managed projects (those with phases).
         # This prevents overwriting hand-crafted Obsidian project docs that exist
         # independently of the workflow system.
         if self._obsidian_dir and project.obsidian_file and project.phases:
             try:
-                obs_path = self._obsidian_dir / project.obsidian_file
-                obs_path.parent.mkdir(parents=True, exist_ok=True)
-                content = render_obsidian(project, str(self._obsidian_dir))
-                self._atomic_write(obs_path, content)
+                self._write_obsidian(project, force=False)
             except Exception as e:
                 logger.warning(f"Failed to render Obsidian file: {e}")
 
+    def _write_obsidian(self, project: Project, *, force: bool) -> None:
+        """Render the project's Obsidian file, skipping the rewrite if nothing visible changed.
+
+        Only the render timestamps differ between most checkpoints; rewriting
+        for those alone costs an fsync and rename and wakes file watchers.
+        The file is still rewritten if it was changed or removed on disk.
+        """
+        assert self._obsidian_dir is not None
+        obs_path = self._obsidian_dir / project.obsidian_file
+        content = render_obsidian(project, str(self._obsidian_dir))
+        fingerprint = hashlib.blake2b(_OBSIDIAN_VOLATILE_RE.sub("", content).encode(), digest_size=16).digest()
+        last = self._obsidian_written.get(project.id)
+        if not force and last is not None and last == (fingerprint, _stat_id(obs_path)):
+            return
+        obs_path.parent.mkdir(parents=True, exist_ok=True)
+        self._atomic_write(obs_path, content)
+        self._obsidian_written[project.id] = (fingerprint, _stat_id(obs_path))
+
+    def _write_checkpoint(self, project: Project, checkpoint_path: Path) -> None:
+        """Persist *project* as a delta against the last snapshot, or as a new snapshot.
+
+        A delta carries only the top-level fields whose JSON changed, and just
+        the new journal entries when the journal was only appended to. The
+        first checkpoint in a process, a snapshot changed by someone else, or
+        a delta log due for compaction, gets a full atomic rewrite instead.
+        """
+        fields = {
+            key: _SNAPSHOT_ENCODER.encode(value)
+            for key, value in project_to_dict(project, include_journal=False).items()
+        }
+        journal, kept = self._encode_journal(project)
+        delta_path = checkpoint_path.with_name("checkpoint.delta.ndjson")
+
+        state = self._snapshots.get(project.id)
+        if state is not None and state.delta_lines < _DELTA_COMPACT_LINES and state.delta_bytes < state.snapshot_bytes:
+            if _stat_id(checkpoint_path) == state.file_id:
+                changed = [f'"{key}":{frag}' for key, frag in fields.items() if state.fields.get(key) != frag]
+                parts = [f'"base":"{state.snapshot_id}"', f'"set":{{{",".join(changed)}}}']
+                if kept >= state.journal_len:
+                    if len(journal) > state.journal_len:
+                        parts.append(f'"journal_append":[{",".join(journal[state.journal_len :])}]')
+                else:
+                    parts.append(f'"journal_set":[{",".join(journal)}]')
+                if not changed and len(parts) == 2:
+                    return
+                line = f"{{{','.join(parts)}}}\n".encode()
+                fd = os.open(str(delta_path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                try:
+                    os.write(fd, line)
+                    _datasync(fd)
+                finally:
+                    os.close(fd)
+                state.fields = fields
+                state.journal_len = len(journal)
+                state.delta_lines += 1
+                state.delta_bytes += len(line)
+                return
+
+        snapshot_id = os.urandom(6).hex()
+        body = ",".join(f'"{key}":{frag}' for key, frag in fields.items())
+        content = f'{{{body},"journal":[{",".join(journal)}],"_snapshot_id":"{snapshot_id}"}}'.encode()
+        self._atomic_write(checkpoint_path, content)
+        # Deltas against the previous snapshot are ignored once this one is in place
+        delta_path.unlink(missing_ok=True)
+        self._snapshots[project.id] = _SnapshotState(
+            snapshot_id=snapshot_id,
+            fields=fields,
+            journal_len=len(journal),
+            file_id=_stat_id(checkpoint_path),
+            snapshot_bytes=len(content),
+        )
+
+    def _encode_journal(self, project: Project) -> tuple[list[str], int]:
+        """Return the encoded JSON of each journal entry, and how many came from cache.
+
+        Journal entries are append-only and never mutated, so each entry is
+        encoded once and its JSON kept for as long as the journal still
+        starts with the same entry objects.
+        """
+        entries, fragments = self._journal_json.setdefault(project.id, ([], []))
+        kept = 0
+        for cached, entry in zip(entries, project.journal, strict=False):
+            if cached is not entry:
+                break
+            kept += 1
+        del entries[kept:], fragments[kept:]
+        for entry in project.journal[kept:]:
+            entries.append(entry)
+            fragments.append(_SNAPSHOT_ENCODER.encode(_journal_entry_to_dict(entry)))
+        return fragments, kept
+
     async def resume(self, project_id: str) -> Project:
         """Resume a project from checkpoint + event replay.
 
@@ -425,7 +684,10 @@ class FileWorkflowBackend:
         # Try loading checkpoint
         if checkpoint_path.exists():
             try:
-                data = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+                data = json.loads(checkpoint_path.read_bytes())
+                snapshot_id = data.pop("_snapshot_id", None)
+                if snapshot_id:
+                    self._apply_deltas(project_dir / "checkpoint.delta.ndjson", snapshot_id, data)
                 project = project_from_dict(data)
                 base_seq = project.last_event_seq
                 logger.info(f"Loaded checkpoint for {project_id} at seq={base_seq}")
@@ -437,8 +699,9 @@ class FileWorkflowBackend:
         # Replay events
         if events_path.exists():
             events = self._load_events(events_path)
-            # Sort by seq for deterministic replay
-            events.sort(key=lambda e: e["seq"])
+            # Appends are already in seq order; sort only a log that isn't (e.g. hand-merged)
+            if any(a["seq"] >= b["seq"] for a, b in pairwise(events)):
+                events.sort(key=itemgetter("seq"))
 
             if project is None:
                 # Full rebuild from events
@@ -446,7 +709,7 @@ class FileWorkflowBackend:
                 project = self._rebuild_from_events(project_id, events)
             else:
                 # Incremental replay
-                pending = [e for e in events if e["seq"] > base_seq]
+                pending = events[bisect_right(events, base_seq, key=itemgetter("seq")) :]
                 if pending:
                     logger.info(f"Replaying {len(pending)} events for {project_id} (seq > {base_seq})")
                     self._replay_events(project, pending)
@@ -519,20 +782,19 @@ class FileWorkflowBackend:
     async def reconcile_override_obsidian(self, project: Project) -> None:
         """Re-render Obsidian from checkpoint (safe, always works)."""
         if self._obsidian_dir and project.obsidian_file:
-            obs_path = self._obsidian_dir / project.obsidian_file
-            obs_path.parent.mkdir(parents=True, exist_ok=True)
-            content = render_obsidian(project, str(self._obsidian_dir))
-            self._atomic_write(obs_path, content)
+            self._write_obsidian(project, force=True)
 
     # --- Internal helpers ---
 
     @staticmethod
-    def _atomic_write(path: Path, content: str) -> None:
+    def _atomic_write(path: Path, content: str | bytes) -> None:
         """Write atomically via temp file + rename."""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
         path.parent.mkdir(parents=True, exist_ok=True)
         fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
         try:
-            os.write(fd, content.encode("utf-8"))
+            os.write(fd, content)
             os.fsync(fd)
             os.close(fd)
             os.rename(tmp_path, str(path))
@@ -542,19 +804,76 @@ class FileWorkflowBackend:
                 os.unlink(tmp_path)
             raise
 
+    @staticmethod
+    def _apply_deltas(delta_path: Path, snapshot_id: str, data: dict) -> None:
+        """Apply checkpoint deltas recorded against *snapshot_id* to a snapshot dict, in order."""
+        try:
+            f = open(delta_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                try:
+                    delta = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    logger.warning(f"Skipping torn checkpoint delta in {delta_path}")
+                    continue
+                if delta.get("base") != snapshot_id:
+                    continue
+                data.update(delta.get("set", {}))
+                if "journal_set" in delta:
+                    data["journal"] = delta["journal_set"]
+                data.setdefault("journal", []).extend(delta.get("journal_append", ()))
+
     @staticmethod
     def _load_events(events_path: Path) -> list[dict]:
         """Load all events from NDJSON file."""
         events = []
-        for line in events_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if line:
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
-                    logger.warning(f"Skipping malformed event line: {line[:80]}")
+        # Stream raw UTF-8 lines straight into json.loads; peak memory is one
+        # line plus the parsed events, not a copy of the whole log.
+        with open(events_path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        events.append(json.loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        logger.warning(f"Skipping malformed event line: {line[:80].decode('utf-8', 'replace')}")
         return events
 
+    @staticmethod
+    def _last_event_seq(events_path: Path) -> int:
+        """Return the highest seq among well-formed events in the log, or 0.
+
+        Events are normally appended in seq order, so only the tail is read:
+        a 4 KiB window from EOF, widened until it holds a complete parseable
+        line, and the max seq in that window is returned. If the window's
+        seqs are out of order (interleaved writers), the whole log is scanned
+        instead. Torn or malformed lines are skipped, as in a full scan.
+        """
+        try:
+            fd = os.open(str(events_path), os.O_RDONLY)
+        except FileNotFoundError:
+            return 0
+        try:
+            end = os.fstat(fd).st_size
+            window = 4096
+            while True:
+                start = max(0, end - window)
+                lines = os.pread(fd, end - start, start).split(b"\n")
+                if start > 0:
+                    lines = lines[1:]  # first line may begin before the window
+                seqs = [seq for seq in map(_line_seq, lines) if seq is not None]
+                if seqs or start == 0:
+                    break
+                window *= 2
+        finally:
+            os.close(fd)
+        if start > 0 and any(a > b for a, b in pairwise(seqs)):
+            with open(events_path, "rb") as f:
+                seqs = [seq for seq in map(_line_seq, f) if seq is not None]
+        return max(seqs, default=0)
+
     def _rebuild_from_events(self, project_id: str, events: list[dict]) -> Project | None:
         """Rebuild a Project entirely from events (seq=0 -> end)."""
         if not events:
@@ -583,50 +902,13 @@ class FileWorkflowBackend:
 
     @staticmethod
     def _replay_events(project: Project, events: list[dict]) -> None:
-        """Apply events to a project in seq order."""
-        for evt in sorted(events, key=lambda e: e["seq"]):
-            evt_type = evt["type"]
-            payload = evt.get("payload", {})
-            seq = evt["seq"]
-
-            if evt_type == "project.transitioned":
-                try:
-                    project.status = ProjectStatus(payload.get("to", project.status))
-                except ValueError:
-                    pass
-
-            elif evt_type == "phase.started":
-                phase_id = payload.get("phase_id")
-                for p in project.phases:
-                    if p.id == phase_id:
-                        p.status = PhaseStatus.ACTIVE
-                        p.started = evt.get("timestamp")
-                        break
-
-            elif evt_type == "phase.completed":
-                phase_id = payload.get("phase_id")
-                for p in project.phases:
-                    if p.id == phase_id:
-                        p.status = PhaseStatus.COMPLETED
-                        p.completed = evt.get("timestamp")
-                        break
-
-            elif evt_type == "phase.failed":
-                phase_id = payload.get("phase_id")
-                for p in project.phases:
-                    if p.id == phase_id:
-                        p.status = PhaseStatus.FAILED
-                        break
-
-            elif evt_type == "budget.recorded_call":
-                cost = payload.get("cost_usd", 0.0)
-                project.budget.cost_used_usd += cost
-                project.budget.llm_calls_used += 1
-
-            elif evt_type == "plan.written":
-                project.plan_hash = payload.get("plan_hash", "")
-
-            project.last_event_seq = seq
+        """Apply events to a project. *events* must already be in seq order."""
+        phase_by_id = {p.id: p for p in reversed(project.phases)}  # first phase wins on duplicate ids
+        for evt in events:
+            handler = _REPLAY_HANDLERS.get(evt["type"])
+            if handler is not None:
+                handler(project, phase_by_id, evt)
+            project.last_event_seq = evt["seq"]
 
     def get_workspace_path(self, project_id: str) -> Path:
         """Get the workspace directory for a project."""
@@ -638,15 +920,69 @@ class FileWorkflowBackend:
 
     def list_project_ids(self) -> list[str]:
         """List all project IDs with checkpoint or events."""
-        if not self._base.exists():
+        try:
+            with os.scandir(self._base) as it:
+                dirs = sorted((e.name, e.path) for e in it if e.is_dir())
+        except FileNotFoundError:
             return []
-        ids = []
-        for d in sorted(self._base.iterdir()):
-            if d.is_dir() and (d / "checkpoint.json").exists():
-                ids.append(d.name)
-            elif d.is_dir() and (d / "events.ndjson").exists():
-                ids.append(d.name)
-        return ids
+        return [
+            name
+            for name, path in dirs
+            if os.path.exists(os.path.join(path, "checkpoint.json"))
+            or os.path.exists(os.path.join(path, "events.ndjson"))
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Event replay handlers
+# ---------------------------------------------------------------------------
+
+
+def _replay_transitioned(project: Project, phases: dict[str, Phase], evt: dict) -> None:
+    try:
+        project.status = ProjectStatus(evt.get("payload", {}).get("to", project.status))
+    except ValueError:
+        pass
+
+
+def _replay_phase_started(project: Project, phases: dict[str, Phase], evt: dict) -> None:
+    p = phases.get(evt.get("payload", {}).get("phase_id"))
+    if p is not None:
+        p.status = PhaseStatus.ACTIVE
+        p.started = evt.get("timestamp")
+
+
+def _replay_phase_completed(project: Project, phases: dict[str, Phase], evt: dict) -> None:
+    p = phases.get(evt.get("payload", {}).get("phase_id"))
+    if p is not None:
+        p.status = PhaseStatus.COMPLETED
+        p.completed = evt.get("timestamp")
+
+
+def _replay_phase_failed(project: Project, phases: dict[str, Phase], evt: dict) -> None:
+    p = phases.get(evt.get("payload", {}).get("phase_id"))
+    if p is not None:
+        p.status = PhaseStatus.FAILED
+
+
+def _replay_recorded_call(project: Project, phases: dict[str, Phase], evt: dict) -> None:
+    project.budget.cost_used_usd += evt.get("payload", {}).get("cost_usd", 0.0)
+    project.budget.llm_calls_used += 1
+
+
+def _replay_plan_written(project: Project, phases: dict[str, Phase], evt: dict) -> None:
+    project.plan_hash = evt.get("payload", {}).get("plan_hash", "")
+
+
+# Event type -> state change applied on replay; other types only advance last_event_seq
+_REPLAY_HANDLERS: dict[str, Callable[[Project, dict[str, Phase], dict], None]] = {
+    PROJECT_TRANSITIONED: _replay_transitioned,
+    PHASE_STARTED: _replay_phase_started,
+    PHASE_COMPLETED: _replay_phase_completed,
+    PHASE_FAILED: _replay_phase_failed,
+    BUDGET_RECORDED_CALL: _replay_recorded_call,
+    PLAN_WRITTEN: _replay_plan_written,
+}
 
 
 def _journal(actor: str, action: str, content: str) -> dict:
@@ -654,7 +990,7 @@ def _journal(actor: str, action: str, content: str) -> dict:
     from .models import JournalEntry
 
     return JournalEntry(
-        timestamp=datetime.now().isoformat(timespec="seconds"),
+        timestamp=_now_iso(),
         actor=actor,
         action=action,
         content=content,
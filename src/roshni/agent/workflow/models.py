@@ -16,7 +16,10 @@ from __future__ import annotations
 
 import hashlib
 import json
+import math
+import sys
 import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
@@ -43,42 +46,65 @@ class PhaseStatus(StrEnum):
 
 
 # Valid transitions: from_status -> set of allowed to_statuses
-VALID_TRANSITIONS: dict[ProjectStatus, set[ProjectStatus]] = {
-    ProjectStatus.PLANNING: {ProjectStatus.AWAITING_APPROVAL, ProjectStatus.FAILED, ProjectStatus.CANCELLED},
-    ProjectStatus.AWAITING_APPROVAL: {
-        ProjectStatus.EXECUTING,
-        ProjectStatus.PLANNING,
-        ProjectStatus.FAILED,
-        ProjectStatus.CANCELLED,
-    },
-    ProjectStatus.EXECUTING: {
-        ProjectStatus.REVIEWING,
-        ProjectStatus.PAUSED,
-        ProjectStatus.FAILED,
-        ProjectStatus.CANCELLED,
-    },
-    ProjectStatus.REVIEWING: {
-        ProjectStatus.DONE,
-        ProjectStatus.PLANNING,  # replan to address unmet conditions
-        ProjectStatus.PAUSED,
-        ProjectStatus.FAILED,
-        ProjectStatus.CANCELLED,
-    },
-    ProjectStatus.PAUSED: {
-        ProjectStatus.EXECUTING,
-        ProjectStatus.PLANNING,
-        ProjectStatus.FAILED,
-        ProjectStatus.CANCELLED,
-    },
-    ProjectStatus.DONE: {ProjectStatus.PLANNING},  # advance: re-open for new work
-    ProjectStatus.FAILED: {ProjectStatus.PLANNING, ProjectStatus.CANCELLED},
-    ProjectStatus.CANCELLED: set(),
+VALID_TRANSITIONS: dict[ProjectStatus, frozenset[ProjectStatus]] = {
+    ProjectStatus.PLANNING: frozenset({ProjectStatus.AWAITING_APPROVAL, ProjectStatus.FAILED, ProjectStatus.CANCELLED}),
+    ProjectStatus.AWAITING_APPROVAL: frozenset(
+        {
+            ProjectStatus.EXECUTING,
+            ProjectStatus.PLANNING,
+            ProjectStatus.FAILED,
+            ProjectStatus.CANCELLED,
+        }
+    ),
+    ProjectStatus.EXECUTING: frozenset(
+        {
+            ProjectStatus.REVIEWING,
+            ProjectStatus.PAUSED,
+            ProjectStatus.FAILED,
+            ProjectStatus.CANCELLED,
+        }
+    ),
+    ProjectStatus.REVIEWING: frozenset(
+        {
+            ProjectStatus.DONE,
+            ProjectStatus.PLANNING,  # replan to address unmet conditions
+            ProjectStatus.PAUSED,
+            ProjectStatus.FAILED,
+            ProjectStatus.CANCELLED,
+        }
+    ),
+    ProjectStatus.PAUSED: frozenset(
+        {
+            ProjectStatus.EXECUTING,
+            ProjectStatus.PLANNING,
+            ProjectStatus.FAILED,
+            ProjectStatus.CANCELLED,
+        }
+    ),
+    ProjectStatus.DONE: frozenset({ProjectStatus.PLANNING}),  # advance: re-open for new work
+    ProjectStatus.FAILED: frozenset({ProjectStatus.PLANNING, ProjectStatus.CANCELLED}),
+    ProjectStatus.CANCELLED: frozenset(),
 }
 
-TERMINAL_STATUSES = {ProjectStatus.CANCELLED}  # done is NOT terminal — projects can be advanced
+# "Allowed: ..." part of the invalid-transition error, per source status
+_ALLOWED_TEXT = {status: ", ".join(sorted(s.value for s in allowed)) for status, allowed in VALID_TRANSITIONS.items()}
+
+TERMINAL_STATUSES = frozenset({ProjectStatus.CANCELLED})  # done is NOT terminal — projects can be advanced
+
+
+_second_stamp: tuple[int, str] = (-1, "")
 
 
-@dataclass
+def _now_iso() -> str:
+    """Current local time as ISO 8601 to the second, formatted once per second."""
+    global _second_stamp
+    second = int(time.time())
+    if _second_stamp[0] != second:
+        _second_stamp = (second, datetime.fromtimestamp(second).isoformat(timespec="seconds"))
+    return _second_stamp[1]
+
+
+@dataclass(slots=True)
 class WorkflowEvent:
     """Append-only event with monotonic sequencing for deterministic replay.
 
@@ -94,7 +120,7 @@ class WorkflowEvent:
     payload: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TerminalCondition:
     """A condition that determines when a project is done."""
 
@@ -106,7 +132,7 @@ class TerminalCondition:
     evaluation: dict | None = None  # for llm_eval: {met, rationale, evidence}
 
 
-@dataclass
+@dataclass(slots=True)
 class PhaseEntry:
     """A single entry/exit criterion for a phase gate."""
 
@@ -114,7 +140,7 @@ class PhaseEntry:
     met: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtifactSpec:
     """Specification for an expected artifact output from a task."""
 
@@ -123,7 +149,7 @@ class ArtifactSpec:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskSpec:
     """Defines what a worker should do and what it's allowed to use.
 
@@ -142,7 +168,7 @@ class TaskSpec:
     timeout: float = 300.0  # seconds; 0 = no timeout
 
 
-@dataclass
+@dataclass(slots=True)
 class Phase:
     """A project phase with entry/exit criteria and tasks."""
 
@@ -157,7 +183,7 @@ class Phase:
     completed: str | None = None  # ISO 8601
 
 
-@dataclass
+@dataclass(slots=True)
 class JournalEntry:
     """Human-readable log entry for project activity."""
 
@@ -168,7 +194,12 @@ class JournalEntry:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+# One lock for every Budget: the critical section is two additions, so sharing
+# it is cheaper than allocating a lock per project.
+_BUDGET_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
 class Budget:
     """Resource budget for a project with thread-safe tracking.
 
@@ -182,9 +213,6 @@ class Budget:
     llm_calls_used: int = 0
     wall_seconds_used: float = 0.0
 
-    # Thread lock — excluded from serialization
-    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
-
     @property
     def exhausted(self) -> bool:
         """True if any budget dimension is exceeded."""
@@ -196,27 +224,31 @@ class Budget:
 
     def remaining_fraction(self) -> float:
         """Return the smallest remaining fraction across all dimensions (0.0 = exhausted, 1.0 = unused)."""
-        fractions = []
+        fraction = math.inf
         if self.max_cost_usd > 0:
-            fractions.append(max(0.0, 1.0 - self.cost_used_usd / self.max_cost_usd))
+            fraction = min(fraction, max(0.0, 1.0 - self.cost_used_usd / self.max_cost_usd))
         if self.max_llm_calls > 0:
-            fractions.append(max(0.0, 1.0 - self.llm_calls_used / self.max_llm_calls))
+            fraction = min(fraction, max(0.0, 1.0 - self.llm_calls_used / self.max_llm_calls))
         if self.max_wall_seconds > 0:
-            fractions.append(max(0.0, 1.0 - self.wall_seconds_used / self.max_wall_seconds))
-        return min(fractions) if fractions else 1.0
+            fraction = min(fraction, max(0.0, 1.0 - self.wall_seconds_used / self.max_wall_seconds))
+        return 1.0 if fraction == math.inf else fraction
+
+    def record_call(self, cost_usd: float, calls: int = 1) -> None:
+        """Thread-safe increment — the ONLY path to log LLM usage.
 
-    def record_call(self, cost_usd: float) -> None:
-        """Thread-safe increment — the ONLY path to log LLM usage."""
-        with self._lock:
+        *calls* lets a caller that made several calls record them (and their
+        total cost) in one locked update.
+        """
+        with _BUDGET_LOCK:
             self.cost_used_usd += cost_usd
-            self.llm_calls_used += 1
+            self.llm_calls_used += calls
 
     def update_wall_time(self, started_at: datetime) -> None:
         """Called by checkpoint(). wall_seconds_used = now - started_at."""
         self.wall_seconds_used = (datetime.now() - started_at).total_seconds()
 
     def to_dict(self) -> dict[str, Any]:
-        """Serialize to dict (excludes lock)."""
+        """Serialize to dict."""
         return {
             "max_cost_usd": self.max_cost_usd,
             "max_llm_calls": self.max_llm_calls,
@@ -239,17 +271,17 @@ class Budget:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Artifact:
     """A named output produced by a worker."""
 
     name: str
     path: str  # relative to workspace artifacts/
     mime_type: str = "text/markdown"
-    created: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+    created: str = field(default_factory=_now_iso)
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """A long-running multi-phase project."""
 
@@ -262,8 +294,8 @@ class Project:
     journal: list[JournalEntry] = field(default_factory=list)
     budget: Budget = field(default_factory=Budget)
     artifacts: list[Artifact] = field(default_factory=list)
-    created: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
-    updated: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+    created: str = field(default_factory=_now_iso)
+    updated: str = field(default_factory=_now_iso)
     tags: list[str] = field(default_factory=list)
     obsidian_file: str = ""  # relative to projects_dir
     workspace_dir: str = ""
@@ -274,6 +306,11 @@ class Project:
     plan_hash: str = ""  # hash of canonical plan.json
 
 
+# Built once: json.dumps constructs a fresh encoder on every call that passes options.
+# The output must stay byte-identical, or stored plan hashes stop matching.
+_PLAN_HASH_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=True)
+
+
 def compute_plan_hash(project: Project) -> str:
     """Compute a deterministic hash of the plan-relevant parts of a project."""
     plan_data = {
@@ -294,27 +331,24 @@ def compute_plan_hash(project: Project) -> str:
             {"description": tc.description, "type": tc.type, "params": tc.params} for tc in project.terminal_conditions
         ],
     }
-    raw = json.dumps(plan_data, sort_keys=True, ensure_ascii=True)
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    return hashlib.sha256(_PLAN_HASH_ENCODER.encode(plan_data).encode("ascii")).hexdigest()[:16]
 
 
 def validate_transition(current: ProjectStatus, target: ProjectStatus) -> None:
     """Raise ValueError if the transition is invalid."""
-    allowed = VALID_TRANSITIONS.get(current, set())
-    if target not in allowed:
+    if target not in VALID_TRANSITIONS.get(current, frozenset()):
         raise ValueError(
-            f"Invalid transition: {current.value} -> {target.value}. "
-            f"Allowed: {', '.join(s.value for s in sorted(allowed, key=lambda s: s.value))}"
+            f"Invalid transition: {current.value} -> {target.value}. Allowed: {_ALLOWED_TEXT.get(current, '')}"
         )
 
 
 def _phase_to_dict(phase: Phase) -> dict[str, Any]:
-    """Serialize a Phase to a dict (avoids asdict on nested dataclasses with Locks)."""
+    """Serialize a Phase to a dict with just the persisted fields."""
     return {
         "id": phase.id,
         "name": phase.name,
         "description": phase.description,
-        "status": phase.status.value if isinstance(phase.status, PhaseStatus) else phase.status,
+        "status": str(phase.status),  # StrEnum str() is its value
         "entry_criteria": [{"description": e.description, "met": e.met} for e in phase.entry_criteria],
         "exit_criteria": [{"description": e.description, "met": e.met} for e in phase.exit_criteria],
         "tasks": [
@@ -337,16 +371,29 @@ def _phase_to_dict(phase: Phase) -> dict[str, Any]:
     }
 
 
-def project_to_dict(project: Project) -> dict[str, Any]:
+def _journal_entry_to_dict(entry: JournalEntry) -> dict[str, Any]:
+    """Serialize a JournalEntry to a dict."""
+    return {
+        "timestamp": entry.timestamp,
+        "actor": entry.actor,
+        "action": entry.action,
+        "content": entry.content,
+        "metadata": entry.metadata,
+    }
+
+
+def project_to_dict(project: Project, *, include_journal: bool = True) -> dict[str, Any]:
     """Serialize a Project to a JSON-safe dict.
 
-    Cannot use dataclasses.asdict() because Budget contains a threading.Lock
-    which is not deepcopy-able.
+    Hand-rolled rather than dataclasses.asdict(), which deep-copies every
+    value; this also pins down exactly which fields are persisted. With
+    ``include_journal=False`` the (possibly long) journal is left out, for
+    callers that serialize it separately.
     """
-    return {
+    data = {
         "id": project.id,
         "goal": project.goal,
-        "status": project.status.value if isinstance(project.status, ProjectStatus) else project.status,
+        "status": str(project.status),
         "schema_version": project.schema_version,
         "terminal_conditions": [
             {
@@ -360,16 +407,6 @@ def project_to_dict(project: Project) -> dict[str, Any]:
             for tc in project.terminal_conditions
         ],
         "phases": [_phase_to_dict(p) for p in project.phases],
-        "journal": [
-            {
-                "timestamp": j.timestamp,
-                "actor": j.actor,
-                "action": j.action,
-                "content": j.content,
-                "metadata": j.metadata,
-            }
-            for j in project.journal
-        ],
         "budget": project.budget.to_dict(),
         "artifacts": [
             {"name": a.name, "path": a.path, "mime_type": a.mime_type, "created": a.created} for a in project.artifacts
@@ -385,10 +422,24 @@ def project_to_dict(project: Project) -> dict[str, Any]:
         "last_event_seq": project.last_event_seq,
         "plan_hash": project.plan_hash,
     }
+    if include_journal:
+        data["journal"] = [_journal_entry_to_dict(j) for j in project.journal]
+    return data
+
+
+# Plain dict lookups for loading; calling the enum class goes through EnumType.__call__.
+# A miss falls back to the call, which raises the usual ValueError.
+_PROJECT_STATUS_BY_VALUE = {s.value: s for s in ProjectStatus}
+_PHASE_STATUS_BY_VALUE = {s.value: s for s in PhaseStatus}
 
 
 def project_from_dict(data: dict[str, Any]) -> Project:
-    """Deserialize a Project from a dict."""
+    """Deserialize a Project from a dict.
+
+    Phase and task IDs, dependency references and journal actors are
+    interned: the same few strings recur across phases, events and every
+    loaded project, and are compared and used as dict keys throughout.
+    """
     data = dict(data)  # shallow copy to avoid mutating caller's dict
     budget_data = data.pop("budget", {})
     phases_data = data.pop("phases", [])
@@ -398,7 +449,7 @@ def project_from_dict(data: dict[str, Any]) -> Project:
 
     # Convert status string to enum
     if "status" in data and isinstance(data["status"], str):
-        data["status"] = ProjectStatus(data["status"])
+        data["status"] = _PROJECT_STATUS_BY_VALUE.get(data["status"]) or ProjectStatus(data["status"])
 
     phases = []
     for pd in phases_data:
@@ -407,14 +458,20 @@ def project_from_dict(data: dict[str, Any]) -> Project:
         entry_criteria = [PhaseEntry(**e) for e in pd.pop("entry_criteria", [])]
         exit_criteria = [PhaseEntry(**e) for e in pd.pop("exit_criteria", [])]
         for t in tasks:
+            t.id = sys.intern(t.id)
+            t.depends_on = [sys.intern(d) for d in t.depends_on]
             if isinstance(t.artifact_outputs, list):
                 t.artifact_outputs = [ArtifactSpec(**a) if isinstance(a, dict) else a for a in t.artifact_outputs]
         # Convert phase status string to enum
         if "status" in pd and isinstance(pd["status"], str):
-            pd["status"] = PhaseStatus(pd["status"])
-        phases.append(Phase(**pd, tasks=tasks, entry_criteria=entry_criteria, exit_criteria=exit_criteria))
+            pd["status"] = _PHASE_STATUS_BY_VALUE.get(pd["status"]) or PhaseStatus(pd["status"])
+        phase = Phase(**pd, tasks=tasks, entry_criteria=entry_criteria, exit_criteria=exit_criteria)
+        phase.id = sys.intern(phase.id)
+        phases.append(phase)
 
     journal = [JournalEntry(**j) for j in journal_data]
+    for entry in journal:
+        entry.actor = sys.intern(entry.actor)
     terminal_conditions = [TerminalCondition(**tc) for tc in tc_data]
     artifacts = [Artifact(**a) for a in artifacts_data]
 
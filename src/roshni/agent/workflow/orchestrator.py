@@ -11,9 +11,10 @@ Internal tools (NOT exposed to Hakim):
 
 from __future__ import annotations
 
+import asyncio
 import json
+from bisect import bisect_left
 from collections.abc import Callable
-from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
@@ -40,13 +41,14 @@ from .models import (
     ProjectStatus,
     TaskSpec,
     TerminalCondition,
-    compute_plan_hash,
+    _now_iso,
     validate_transition,
 )
 from .store import ProjectStore
-from .worker import WorkerPool
+from .worker import WorkerPool, WorkerResult
 
 if TYPE_CHECKING:
+    from roshni.agent.default import DefaultAgent
     from roshni.agent.tools import ToolDefinition
     from roshni.core.config import Config
     from roshni.core.events import EventBus
@@ -56,6 +58,64 @@ if TYPE_CHECKING:
 SendFn = Callable[[str], Any]  # async or sync callback to send messages to user
 
 
+# Budget warnings: remaining fraction at or below each threshold (ascending) -> share used
+_BUDGET_WARN_REMAINING = (0.05, 0.2, 0.5)
+_BUDGET_WARN_LABELS = ("95%", "80%", "50%")
+
+# Projects per review prompt; larger reviews are split and merged
+_REVIEW_SHARD_SIZE = 8
+
+
+def _project_summary(p: Project) -> str:
+    """Summarize one project for the review prompt."""
+    completed = sum(1 for ph in p.phases if ph.status == PhaseStatus.COMPLETED)
+    lines = [
+        f"### {p.id}: {p.goal}",
+        f"Status: {p.status.value} | Tags: {', '.join(p.tags) if p.tags else 'none'}",
+        f"Phases: {completed}/{len(p.phases)} completed",
+    ]
+    if p.artifacts:
+        lines.append(f"Artifacts: {', '.join(a.name for a in p.artifacts)}")
+    # Include recent journal entries for context
+    if p.journal:
+        lines.append("Recent activity:")
+        lines.extend(f"  - [{j.actor}] {j.action}: {j.content[:100]}" for j in p.journal[-3:])
+    # Include unmet terminal conditions
+    unmet = [tc for tc in p.terminal_conditions if not tc.met]
+    if unmet:
+        lines.append("Unmet conditions:")
+        lines.extend(f"  - {tc.description}" for tc in unmet)
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _strip_fence(text: str) -> str:
+    """Strip a surrounding markdown code fence (```json ... ```) from an LLM reply, if present."""
+    text = text.strip()
+    if not text.startswith("```"):
+        return text
+    _, _, body = text.partition("\n")
+    return body.removesuffix("```").rstrip()
+
+
+def _search_text(p: Project) -> str:
+    """Goal, phase names and tags lowercased in one string, NUL-separated so a match can't span two fields."""
+    return "\0".join([p.goal, *(ph.name for ph in p.phases), *p.tags]).lower()
+
+
+def _review_prompt(context: str, query: str) -> str:
+    return (
+        f"You are a personal project advisor. Analyze these projects and provide:\n"
+        f"1. Cross-cutting themes and connections\n"
+        f"2. Key findings and progress summary\n"
+        f"3. Recommended next actions (prioritized)\n"
+        f"4. Any risks or stalled areas\n\n"
+        f"{'Query: ' + query + chr(10) if query else ''}"
+        f"## Projects\n\n{context}\n\n"
+        f"Be concise and actionable. Focus on insights the user might miss."
+    )
+
+
 class Orchestrator:
     """The orchestrator decomposes goals, manages phases, and evaluates terminal conditions.
 
@@ -100,9 +160,8 @@ class Orchestrator:
         try:
             await self._decompose_goal(project)
             # Save plan
-            await self._backend.save_plan(project)
-            plan_hash = compute_plan_hash(project)
-            project.plan_hash = plan_hash
+            await self._backend.save_plan(project)  # also sets project.plan_hash
+            plan_hash = project.plan_hash
 
             # Record plan event
             evt = self._backend.create_event(project.id, PLAN_WRITTEN, "orchestrator", {"plan_hash": plan_hash})
@@ -119,14 +178,7 @@ class Orchestrator:
             )
         except Exception as e:
             logger.error(f"Failed to plan project {project.id}: {e}")
-            project.journal.append(
-                JournalEntry(
-                    timestamp=datetime.now().isoformat(timespec="seconds"),
-                    actor="orchestrator",
-                    action="error",
-                    content=f"Planning failed: {e}",
-                )
-            )
+            self._log(project, "error", f"Planning failed: {e}")
             await self._transition(project, ProjectStatus.FAILED)
 
         await self._store.update(project)
@@ -149,14 +201,7 @@ class Orchestrator:
             await self._execute_phases(project)
         except Exception as e:
             logger.error(f"Execution failed for {project_id}: {e}")
-            project.journal.append(
-                JournalEntry(
-                    timestamp=datetime.now().isoformat(timespec="seconds"),
-                    actor="orchestrator",
-                    action="error",
-                    content=f"Execution failed: {e}",
-                )
-            )
+            self._log(project, "error", f"Execution failed: {e}")
             if project.status not in {ProjectStatus.PAUSED, ProjectStatus.CANCELLED}:
                 await self._transition(project, ProjectStatus.FAILED)
             await self._store.update(project)
@@ -167,14 +212,7 @@ class Orchestrator:
         if project is None:
             raise ValueError(f"Project not found: {project_id}")
 
-        project.journal.append(
-            JournalEntry(
-                timestamp=datetime.now().isoformat(timespec="seconds"),
-                actor="user",
-                action="steering",
-                content=direction,
-            )
-        )
+        self._log(project, "steering", direction, actor="user")
 
         from .events import PROJECT_STEERED
 
@@ -204,14 +242,7 @@ class Orchestrator:
         await self._backend.record_event(project_id, evt)
         project.last_event_seq = evt.seq
 
-        project.journal.append(
-            JournalEntry(
-                timestamp=datetime.now().isoformat(timespec="seconds"),
-                actor="user",
-                action="reconcile",
-                content=f"Conflict resolved: {strategy}",
-            )
-        )
+        self._log(project, "reconcile", f"Conflict resolved: {strategy}", actor="user")
 
         await self._store.update(project)
         logger.info(f"Conflict reconciled for {project_id}: {strategy}")
@@ -247,9 +278,8 @@ class Orchestrator:
                 project.last_event_seq = evt.seq
 
                 # Save updated plan
-                await self._backend.save_plan(project)
-                plan_hash = compute_plan_hash(project)
-                project.plan_hash = plan_hash
+                await self._backend.save_plan(project)  # also sets project.plan_hash
+                plan_hash = project.plan_hash
 
                 evt = self._backend.create_event(project.id, PLAN_WRITTEN, "orchestrator", {"plan_hash": plan_hash})
                 await self._backend.record_event(project.id, evt)
@@ -265,14 +295,7 @@ class Orchestrator:
 
             except Exception as e:
                 logger.error(f"Failed to advance project {project_id}: {e}")
-                project.journal.append(
-                    JournalEntry(
-                        timestamp=datetime.now().isoformat(timespec="seconds"),
-                        actor="orchestrator",
-                        action="error",
-                        content=f"Advance failed: {e}",
-                    )
-                )
+                self._log(project, "error", f"Advance failed: {e}")
                 if project.status not in {ProjectStatus.PAUSED, ProjectStatus.CANCELLED}:
                     await self._transition(project, ProjectStatus.FAILED)
                 await self._store.update(project)
@@ -311,80 +334,83 @@ class Orchestrator:
         if not projects:
             return "No projects found."
 
-        # Filter by tags if provided
-        if tags:
-            tag_set = set(tags)
-            projects = [p for p in projects if tag_set & set(p.tags)]
-
-        # Filter by query (simple keyword match on goal + phase names)
-        if query:
+        # Filter by tags and query (simple keyword match on goal, phase names and tags) in one pass
+        if tags or query:
+            tag_set = frozenset(tags or ())
             query_lower = query.lower()
             projects = [
                 p
                 for p in projects
-                if query_lower in p.goal.lower()
-                or any(query_lower in ph.name.lower() for ph in p.phases)
-                or any(query_lower in t for t in p.tags)
+                if (not tag_set or not tag_set.isdisjoint(p.tags)) and (not query or query_lower in _search_text(p))
             ]
 
         if not projects:
             return f"No projects matching query='{query}' tags={tags}."
 
-        # Build context for synthesis
-        context_parts = []
-        for p in projects:
-            completed = sum(1 for ph in p.phases if ph.status == PhaseStatus.COMPLETED)
-            part = (
-                f"### {p.id}: {p.goal}\n"
-                f"Status: {p.status.value} | Tags: {', '.join(p.tags) if p.tags else 'none'}\n"
-                f"Phases: {completed}/{len(p.phases)} completed\n"
-            )
-            if p.artifacts:
-                part += f"Artifacts: {', '.join(a.name for a in p.artifacts)}\n"
-            # Include recent journal entries for context
-            if p.journal:
-                recent = p.journal[-3:]
-                part += "Recent activity:\n"
-                for j in recent:
-                    part += f"  - [{j.actor}] {j.action}: {j.content[:100]}\n"
-            # Include unmet terminal conditions
-            unmet = [tc for tc in p.terminal_conditions if not tc.met]
-            if unmet:
-                part += "Unmet conditions:\n"
-                for tc in unmet:
-                    part += f"  - {tc.description}\n"
-            context_parts.append(part)
-
-        context = "\n---\n".join(context_parts)
-
-        # Run LLM synthesis
-        from roshni.agent.default import DefaultAgent
-
-        reviewer = DefaultAgent(
-            self._config,
-            self._secrets,
-            tools=[],
-            name="project-reviewer",
-            model_selector=self._model_selector,
+        summaries = [_project_summary(p) for p in projects]
+        if len(summaries) <= _REVIEW_SHARD_SIZE:
+            try:
+                result = await self._new_reviewer().invoke(
+                    _review_prompt("\n---\n".join(summaries), query), channel="workflow"
+                )
+                return result.strip()
+            except Exception as e:
+                logger.error(f"Review synthesis failed: {e}")
+                return f"Error generating review: {e}"
+
+        # Too many projects for one prompt: review shards concurrently, then merge
+        starts = range(0, len(summaries), _REVIEW_SHARD_SIZE)
+        shards = ["\n---\n".join(summaries[i : i + _REVIEW_SHARD_SIZE]) for i in starts]
+        results = await asyncio.gather(
+            *(self._new_reviewer().invoke(_review_prompt(shard, query), channel="workflow") for shard in shards),
+            return_exceptions=True,
         )
-
-        prompt = (
-            f"You are a personal project advisor. Analyze these projects and provide:\n"
+        partials = []
+        missing: list[Project] = []
+        for n, (start, shard_result) in enumerate(zip(starts, results, strict=True), 1):
+            if isinstance(shard_result, BaseException):
+                logger.warning(f"Review shard {n}/{len(shards)} failed: {shard_result}")
+                missing.extend(projects[start : start + _REVIEW_SHARD_SIZE])
+            else:
+                partials.append(shard_result.strip())
+        if not partials:
+            return "Error generating review: all review shards failed"
+        # Say which projects the review leaves out, rather than let it read as complete
+        missing_text = ", ".join(f"{p.id} ({p.goal})" for p in missing)
+
+        parts_text = "\n".join(f"### Part {i}\n{part}\n" for i, part in enumerate(partials, 1))
+        reduce_prompt = (
+            f"You are a personal project advisor. Each review below covers a different subset of "
+            f"the user's projects. Merge them into one review with:\n"
             f"1. Cross-cutting themes and connections\n"
             f"2. Key findings and progress summary\n"
             f"3. Recommended next actions (prioritized)\n"
             f"4. Any risks or stalled areas\n\n"
             f"{'Query: ' + query + chr(10) if query else ''}"
-            f"## Projects\n\n{context}\n\n"
+            f"## Partial reviews\n\n{parts_text}\n"
+            f"{'Not reviewed (review failed): ' + missing_text + chr(10) + chr(10) if missing else ''}"
             f"Be concise and actionable. Focus on insights the user might miss."
         )
-
         try:
-            result = await reviewer.invoke(prompt, channel="workflow")
-            return result.strip()
+            result = await self._new_reviewer().invoke(reduce_prompt, channel="workflow")
         except Exception as e:
             logger.error(f"Review synthesis failed: {e}")
             return f"Error generating review: {e}"
+        if missing:
+            return f"{result.strip()}\n\nReview unavailable for: {missing_text}"
+        return result.strip()
+
+    def _new_reviewer(self) -> DefaultAgent:
+        """Build a fresh reviewer agent (agents keep history, so one per prompt)."""
+        from roshni.agent.default import DefaultAgent
+
+        return DefaultAgent(
+            self._config,
+            self._secrets,
+            tools=[],
+            name="project-reviewer",
+            model_selector=self._model_selector,
+        )
 
     # -- Internal: planning --------------------------------------------------
 
@@ -456,13 +482,7 @@ class Orchestrator:
         # Parse the structured plan
         try:
             # Try to extract JSON from the response
-            plan_text = result.strip()
-            # Remove markdown code fencing if present
-            if plan_text.startswith("```"):
-                lines = plan_text.split("\n")
-                plan_text = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
-
-            plan = json.loads(plan_text)
+            plan = json.loads(_strip_fence(result))
             phases_data = plan.get("phases", [])
 
             for i, pd in enumerate(phases_data):
@@ -492,14 +512,7 @@ class Orchestrator:
                     )
                 )
 
-            project.journal.append(
-                JournalEntry(
-                    timestamp=datetime.now().isoformat(timespec="seconds"),
-                    actor="orchestrator",
-                    action="planned",
-                    content=f"Decomposed goal into {len(project.phases)} phases",
-                )
-            )
+            self._log(project, "planned", f"Decomposed goal into {len(project.phases)} phases")
 
         except (json.JSONDecodeError, KeyError) as e:
             logger.warning(f"Failed to parse plan JSON: {e}")
@@ -512,14 +525,7 @@ class Orchestrator:
                     tasks=[TaskSpec(id="task-001", description=project.goal)],
                 )
             )
-            project.journal.append(
-                JournalEntry(
-                    timestamp=datetime.now().isoformat(timespec="seconds"),
-                    actor="orchestrator",
-                    action="planned",
-                    content="Fallback: created single-phase plan (LLM output not parseable)",
-                )
-            )
+            self._log(project, "planned", "Fallback: created single-phase plan (LLM output not parseable)")
 
     async def _plan_advance(self, project: Project, directive: str) -> Phase:
         """Plan new phase(s) for advancing an existing project.
@@ -580,13 +586,8 @@ class Orchestrator:
         result = await planner.invoke(context, channel="workflow")
 
         # Parse the new phase
-        plan_text = result.strip()
-        if plan_text.startswith("```"):
-            lines = plan_text.split("\n")
-            plan_text = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
-
         try:
-            plan = json.loads(plan_text)
+            plan = json.loads(_strip_fence(result))
             phases_data = plan.get("phases", [])
             if not phases_data:
                 raise ValueError("No phases in LLM response")
@@ -627,14 +628,7 @@ class Orchestrator:
             )
 
         project.phases.append(new_phase)
-        project.journal.append(
-            JournalEntry(
-                timestamp=datetime.now().isoformat(timespec="seconds"),
-                actor="orchestrator",
-                action="advanced",
-                content=f"Added phase {new_phase.id}: {new_phase.name}",
-            )
-        )
+        self._log(project, "advanced", f"Added phase {new_phase.id}: {new_phase.name}")
         return new_phase
 
     # -- Internal: execution -------------------------------------------------
@@ -650,17 +644,12 @@ class Orchestrator:
 
             # Check budget
             if project.budget.exhausted:
-                project.journal.append(
-                    JournalEntry(
-                        timestamp=datetime.now().isoformat(timespec="seconds"),
-                        actor="orchestrator",
-                        action="budget_warning",
-                        content=(
-                            f"Budget exhausted: "
-                            f"${project.budget.cost_used_usd:.2f}/${project.budget.max_cost_usd:.2f} USD, "
-                            f"{project.budget.llm_calls_used}/{project.budget.max_llm_calls} calls"
-                        ),
-                    )
+                self._log(
+                    project,
+                    "budget_warning",
+                    f"Budget exhausted: "
+                    f"${project.budget.cost_used_usd:.2f}/${project.budget.max_cost_usd:.2f} USD, "
+                    f"{project.budget.llm_calls_used}/{project.budget.max_llm_calls} calls",
                 )
                 evt = self._backend.create_event(
                     project.id,
@@ -674,18 +663,16 @@ class Orchestrator:
                 break
 
             # Budget warnings at thresholds
-            remaining = project.budget.remaining_fraction()
-            for threshold, pct in [(0.5, "50%"), (0.2, "80%"), (0.05, "95%")]:
-                if remaining <= threshold:
-                    evt = self._backend.create_event(
-                        project.id,
-                        BUDGET_WARNING,
-                        "orchestrator",
-                        {"threshold": pct},
-                    )
-                    await self._backend.record_event(project.id, evt)
-                    project.last_event_seq = evt.seq
-                    break
+            level = bisect_left(_BUDGET_WARN_REMAINING, project.budget.remaining_fraction())
+            if level < len(_BUDGET_WARN_REMAINING):
+                evt = self._backend.create_event(
+                    project.id,
+                    BUDGET_WARNING,
+                    "orchestrator",
+                    {"threshold": _BUDGET_WARN_LABELS[level]},
+                )
+                await self._backend.record_event(project.id, evt)
+                project.last_event_seq = evt.seq
 
             # Start phase
             await self._start_phase(project, phase)
@@ -711,83 +698,90 @@ class Orchestrator:
     async def _start_phase(self, project: Project, phase: Phase) -> None:
         """Mark a phase as active."""
         phase.status = PhaseStatus.ACTIVE
-        phase.started = datetime.now().isoformat(timespec="seconds")
+        phase.started = _now_iso()
 
         evt = self._backend.create_event(project.id, PHASE_STARTED, "orchestrator", {"phase_id": phase.id})
         await self._backend.record_event(project.id, evt)
         project.last_event_seq = evt.seq
 
-        project.journal.append(
-            JournalEntry(
-                timestamp=phase.started,
-                actor="orchestrator",
-                action="phase_started",
-                content=f"Started phase: {phase.name}",
-            )
-        )
+        self._log(project, "phase_started", f"Started phase: {phase.name}", timestamp=phase.started)
         await self._report(f"Phase started: {phase.name}")
         await self._store.update(project)
 
     async def _execute_phase_tasks(self, project: Project, phase: Phase) -> bool:
-        """Execute all tasks in a phase. Returns True if all succeeded."""
+        """Execute all tasks in a phase. Returns True if all succeeded.
+
+        Tasks are independent unless one declares ``depends_on``; then the
+        phase falls back to running them one at a time, in order.
+        """
         if not self._worker_pool:
-            project.journal.append(
-                JournalEntry(
-                    timestamp=datetime.now().isoformat(timespec="seconds"),
-                    actor="orchestrator",
-                    action="error",
-                    content="No worker pool available",
-                )
-            )
+            self._log(project, "error", "No worker pool available")
             return False
 
-        all_success = True
-        for task in phase.tasks:
-            if project.status in {ProjectStatus.PAUSED, ProjectStatus.CANCELLED}:
-                return False
-            if project.budget.exhausted:
-                return False
+        if any(task.depends_on for task in phase.tasks):
+            # Dependencies aren't scheduled yet: run in declared order, stopping at the first failure
+            for task in phase.tasks:
+                if not self._task_succeeded(project, await self._run_task(project, phase, task)):
+                    return False
+            return True
+
+        # Independent tasks run concurrently; the worker pool bounds how many are in flight.
+        # The first failure fails the phase: tasks not yet started are withdrawn, while
+        # workers already running (in executor threads) finish and are recorded.
+        abort = asyncio.Event()
+        pending = [asyncio.create_task(self._run_task(project, phase, task, abort)) for task in phase.tasks]
+        succeeded = True
+        try:
+            for next_done in asyncio.as_completed(pending):
+                if not self._task_succeeded(project, await next_done):
+                    succeeded = False
+                    abort.set()
+        except BaseException:
+            abort.set()
+            for t in pending:
+                t.cancel()
+            raise
+        return succeeded
+
+    def _task_succeeded(self, project: Project, result: WorkerResult | None) -> bool:
+        """Journal a failed task result. None means the task never ran (project stopped, or phase aborted)."""
+        if result is None:
+            return False
+        if not result.success:
+            self._log(project, "error", f"Task {result.task.id} failed: {result.error}")
+        return result.success
 
-            result = await self._worker_pool.spawn_worker(project, phase, task)
-            if not result.success:
-                all_success = False
-                # Check retry
-                if task.max_attempts > 1:
-                    for attempt in range(2, task.max_attempts + 1):
-                        result = await self._worker_pool.spawn_worker(project, phase, task, attempt=attempt)
-                        if result.success:
-                            all_success = True
-                            break
-                if not result.success:
-                    project.journal.append(
-                        JournalEntry(
-                            timestamp=datetime.now().isoformat(timespec="seconds"),
-                            actor="orchestrator",
-                            action="error",
-                            content=f"Task {task.id} failed: {result.error}",
-                        )
-                    )
-                    break
+    async def _run_task(
+        self, project: Project, phase: Phase, task: TaskSpec, abort: asyncio.Event | None = None
+    ) -> WorkerResult | None:
+        """Run one task with its retries. Returns None if the project can't take new work.
 
-        return all_success
+        Once *abort* is set, no further attempt is started; a task withdrawn
+        before its first attempt ran also returns None.
+        """
+        if project.status in {ProjectStatus.PAUSED, ProjectStatus.CANCELLED}:
+            return None
+        if project.budget.exhausted:
+            return None
+
+        assert self._worker_pool is not None
+        result = await self._worker_pool.spawn_worker(project, phase, task, abort=abort)
+        for attempt in range(2, task.max_attempts + 1):
+            if result is None or result.success or (abort is not None and abort.is_set()):
+                break
+            result = await self._worker_pool.spawn_worker(project, phase, task, attempt=attempt, abort=abort)
+        return result
 
     async def _complete_phase(self, project: Project, phase: Phase) -> None:
         """Mark a phase as completed."""
         phase.status = PhaseStatus.COMPLETED
-        phase.completed = datetime.now().isoformat(timespec="seconds")
+        phase.completed = _now_iso()
 
         evt = self._backend.create_event(project.id, PHASE_COMPLETED, "orchestrator", {"phase_id": phase.id})
         await self._backend.record_event(project.id, evt)
         project.last_event_seq = evt.seq
 
-        project.journal.append(
-            JournalEntry(
-                timestamp=phase.completed,
-                actor="orchestrator",
-                action="phase_completed",
-                content=f"Completed phase: {phase.name}",
-            )
-        )
+        self._log(project, "phase_completed", f"Completed phase: {phase.name}", timestamp=phase.completed)
         await self._report(f"Phase completed: {phase.name}")
         await self._store.update(project)
 
@@ -804,14 +798,7 @@ class Orchestrator:
         await self._backend.record_event(project.id, evt)
         project.last_event_seq = evt.seq
 
-        project.journal.append(
-            JournalEntry(
-                timestamp=datetime.now().isoformat(timespec="seconds"),
-                actor="orchestrator",
-                action="phase_failed",
-                content=f"Phase failed: {phase.name}",
-            )
-        )
+        self._log(project, "phase_failed", f"Phase failed: {phase.name}")
         await self._transition(project, ProjectStatus.FAILED)
         await self._store.update(project)
 
@@ -831,7 +818,7 @@ class Orchestrator:
             met = await self._evaluate_condition(project, tc)
             tc.met = met
             if met:
-                tc.met_at = datetime.now().isoformat(timespec="seconds")
+                tc.met_at = _now_iso()
 
             evt = self._backend.create_event(
                 project.id,
@@ -888,12 +875,7 @@ class Orchestrator:
                     f'Respond with JSON: {{"met": true/false, "rationale": "...", "evidence": [...]}}'
                 )
                 result = await evaluator.invoke(prompt, channel="workflow")
-                # Parse response
-                result_text = result.strip()
-                if result_text.startswith("```"):
-                    lines = result_text.split("\n")
-                    result_text = "\n".join(lines[1:-1])
-                eval_data = json.loads(result_text)
+                eval_data = json.loads(_strip_fence(result))
                 tc.evaluation = eval_data
                 return eval_data.get("met", False)
             except Exception as e:
@@ -913,7 +895,7 @@ class Orchestrator:
         old_status = project.status
         validate_transition(old_status, target)
         project.status = target
-        project.updated = datetime.now().isoformat(timespec="seconds")
+        project.updated = _now_iso()
 
         if target == ProjectStatus.EXECUTING and not project.started_at:
             project.started_at = project.updated
@@ -929,17 +911,19 @@ class Orchestrator:
         await self._backend.record_event(project.id, evt)
         project.last_event_seq = evt.seq
 
-        project.journal.append(
-            JournalEntry(
-                timestamp=project.updated,
-                actor="orchestrator",
-                action="status_change",
-                content=f"{old_status.value} -> {target.value}",
-            )
-        )
+        self._log(project, "status_change", f"{old_status.value} -> {target.value}", timestamp=project.updated)
 
     # -- Internal: reporting -------------------------------------------------
 
+    @staticmethod
+    def _log(
+        project: Project, action: str, content: str, *, actor: str = "orchestrator", timestamp: str | None = None
+    ) -> None:
+        """Append a journal entry to *project* (timestamped now unless given)."""
+        project.journal.append(
+            JournalEntry(timestamp=timestamp or _now_iso(), actor=actor, action=action, content=content)
+        )
+
     async def _report(self, message: str) -> None:
         """Send a status update to the user via send_fn."""
         if self._send_fn:
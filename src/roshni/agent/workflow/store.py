@@ -179,6 +179,7 @@ class ProjectStore:
         legacy_dir = self._base / legacy_id
         slug_dir = self._base / slug
         if legacy_dir.exists() and not slug_dir.exists():
+            self._backend.forget_workspace(legacy_id)
             legacy_dir.rename(slug_dir)
             logger.info(f"Migrated workspace {legacy_id} -> {slug}")
 
@@ -325,6 +326,7 @@ class ProjectStore:
         # Remove workspace
         project_dir = self._backend._project_dir(project_id)
         if project_dir.exists():
+            self._backend.forget_workspace(project_id)
             shutil.rmtree(project_dir)
             deleted = True
 
@@ -71,6 +71,28 @@ def _filter_tools_by_allowlist(
     return [t for t in tools if t.name in allowed_set]
 
 
+def _refuse_spawn(project: Project, task: TaskSpec) -> WorkerResult | None:
+    """Return a failed result if *project* can't take new work (budget spent, paused or cancelled)."""
+    if project.budget.exhausted:
+        return WorkerResult(
+            worker_id="",
+            task=task,
+            response="",
+            success=False,
+            error="Budget exhausted before spawn",
+        )
+    # Pause/cancel = don't schedule new work
+    if project.status in {ProjectStatus.PAUSED, ProjectStatus.CANCELLED}:
+        return WorkerResult(
+            worker_id="",
+            task=task,
+            response="",
+            success=False,
+            error=f"Project is {project.status.value}, not scheduling new work",
+        )
+    return None
+
+
 class WorkerPool:
     """Manages bounded-concurrency worker execution.
 
@@ -107,44 +129,41 @@ class WorkerPool:
         task: TaskSpec,
         *,
         attempt: int = 1,
-    ) -> WorkerResult:
+        abort: asyncio.Event | None = None,
+    ) -> WorkerResult | None:
         """Spawn a worker for a task. Blocks until a semaphore slot is available.
 
-        Checks budget and project status before spawning.
+        Checks budget and project status before spawning, and again once a slot
+        frees up, since the project may have been paused while this task waited.
+        Setting *abort* withdraws the task if its worker hasn't started yet:
+        it returns None and records nothing. A worker already running always
+        finishes and is recorded.
         """
-        # Pre-spawn budget check
-        if project.budget.exhausted:
-            return WorkerResult(
-                worker_id="",
-                task=task,
-                response="",
-                success=False,
-                error="Budget exhausted before spawn",
-            )
+        if abort is not None and abort.is_set():
+            return None
+        refused = _refuse_spawn(project, task)
+        if refused:
+            return refused
 
-        # Check project status (pause/cancel = don't schedule new work)
-        if project.status in {ProjectStatus.PAUSED, ProjectStatus.CANCELLED}:
-            return WorkerResult(
-                worker_id="",
-                task=task,
-                response="",
-                success=False,
-                error=f"Project is {project.status.value}, not scheduling new work",
-            )
+        async with self._semaphore:
+            if abort is not None and abort.is_set():
+                return None
+            refused = _refuse_spawn(project, task)
+            if refused:
+                return refused
 
-        worker_id = f"worker-{uuid.uuid4().hex[:6]}"
+            worker_id = f"worker-{uuid.uuid4().hex[:6]}"
 
-        # Record dispatch event
-        evt = self._backend.create_event(
-            project.id,
-            TASK_DISPATCHED,
-            worker_id,
-            {"phase_id": phase.id, "task_id": task.id, "worker_id": worker_id},
-        )
-        await self._backend.record_event(project.id, evt)
-        project.last_event_seq = evt.seq
+            # Record dispatch event once the worker actually starts, so every dispatch has an outcome
+            evt = self._backend.create_event(
+                project.id,
+                TASK_DISPATCHED,
+                worker_id,
+                {"phase_id": phase.id, "task_id": task.id, "worker_id": worker_id},
+            )
+            await self._backend.record_event(project.id, evt)
+            project.last_event_seq = evt.seq
 
-        async with self._semaphore:
             if task.timeout > 0:
                 try:
                     return await asyncio.wait_for(
@@ -230,9 +249,7 @@ class WorkerPool:
             worker_calls = 1 + len(tool_calls) + (1 if tool_calls else 0)
 
             # Record usage on the project budget
-            project.budget.record_call(0.0)  # count the call; cost tracked globally
-            for _ in range(worker_calls - 1):
-                project.budget.record_call(0.0)
+            project.budget.record_call(0.0, calls=worker_calls)  # count the calls; cost tracked globally
 
             # Collect worker result
             worker_result = WorkerResult(
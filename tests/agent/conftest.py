@@ -0,0 +1,11 @@
+"""Shared fixtures for agent tests."""
+
+import pytest
+
+import roshni.agent.vault as vault_module
+
+
+@pytest.fixture(autouse=True)
+def _vault_index_dir(tmp_path, monkeypatch):
+    """Keep vault search index snapshots out of the real user cache."""
+    monkeypatch.setattr(vault_module, "_DEFAULT_INDEX_DIR", str(tmp_path / "vault-index"))
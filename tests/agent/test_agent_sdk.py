@@ -306,6 +306,22 @@ class TestAgentSDKToolConversion:
         server = _build_mcp_server([echo_tool, calc_tool])
         assert server is not None
 
+    async def test_mcp_tool_runs_off_event_loop(self):
+        import threading
+
+        from roshni.agent.agent_sdk import _build_mcp_server
+
+        loop_thread = threading.get_ident()
+        tool = ToolDefinition(
+            name="where",
+            description="Report the calling thread",
+            parameters={"type": "object", "properties": {}},
+            function=lambda: "loop" if threading.get_ident() == loop_thread else "worker",
+        )
+        server = _build_mcp_server([tool])
+        result = await server.tools[0]({})
+        assert result["content"][0]["text"] == "worker"
+
     def test_build_mcp_server_empty_params(self):
         from roshni.agent.agent_sdk import _build_mcp_server
 
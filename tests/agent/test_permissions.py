@@ -1,6 +1,6 @@
 """Tests for roshni.agent.permissions."""
 
-from roshni.agent.permissions import PermissionTier, filter_tools_by_tier, get_domain_tier
+from roshni.agent.permissions import PermissionTier, filter_tools_by_tier, get_domain_tier, tier_allows
 from roshni.agent.tools import ToolDefinition
 
 
@@ -50,6 +50,23 @@ class TestGetDomainTier:
         assert get_domain_tier({"x": "bogus"}, "x") == PermissionTier.INTERACT
 
 
+# -- tier_allows --
+
+
+class TestTierAllows:
+    def test_read_needs_observe(self):
+        assert tier_allows(PermissionTier.OBSERVE, "read")
+        assert not tier_allows(PermissionTier.NONE, "read")
+
+    def test_write_needs_interact(self):
+        assert tier_allows(PermissionTier.INTERACT, "write")
+        assert not tier_allows(PermissionTier.OBSERVE, "write")
+
+    def test_unknown_permission_needs_full(self):
+        assert tier_allows(PermissionTier.FULL, "mystery")
+        assert not tier_allows(PermissionTier.INTERACT, "mystery")
+
+
 # -- filter_tools_by_tier --
 
 
@@ -1,8 +1,13 @@
 """Tests for VaultManager."""
 
 import os
+import re
+import sys
+import threading
+from datetime import datetime
 
-from roshni.agent.vault import VaultManager
+import roshni.agent.vault as vault_module
+from roshni.agent.vault import VaultManager, _extract_snippets, _match_offsets
 
 
 class TestInit:
@@ -75,12 +80,51 @@ class TestLogAction:
         assert "`save_person`" in audit
         assert "name=Alice" in audit
 
+    def test_entry_timestamp_is_local_seconds(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.log_action("save", "first")
+        vm.log_action("save", "second")
+        stamps = re.findall(r"- `([^`]+)` \*\*save\*\*", (vm.admin_dir / "audit.md").read_text())
+        assert len(stamps) == 2
+        for stamp in stamps:
+            datetime.strptime(stamp, "%Y-%m-%d %H:%M:%S")
+
     def test_creates_audit_if_missing(self, tmp_dir):
         vm = VaultManager(tmp_dir)
         # Don't scaffold — log_action should still work
         vm.log_action("test", "test_tool")
         assert (vm.admin_dir / "audit.md").exists()
 
+    def test_entries_visible_immediately_and_after_close(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        vm.log_action("save", "first")
+        vm.log_action("save", "second")
+        audit = (vm.admin_dir / "audit.md").read_text()
+        assert audit.index("`first`") < audit.index("`second`")
+
+        vm.close()
+        vm.close()
+        vm.log_action("save", "third")  # reopens after close
+        assert "`third`" in (vm.admin_dir / "audit.md").read_text()
+
+    def test_reopens_after_audit_file_is_deleted_or_replaced(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        audit_path = vm.admin_dir / "audit.md"
+        vm.log_action("save", "first")
+
+        audit_path.unlink()
+        vm.log_action("save", "second")
+        assert "`second`" in audit_path.read_text()
+
+        audit_path.rename(vm.admin_dir / "audit.old.md")
+        audit_path.write_text("# Audit Log\n\n")
+        vm.log_action("save", "third")
+        assert "`third`" in audit_path.read_text()
+        assert "`third`" not in (vm.admin_dir / "audit.old.md").read_text()
+        vm.close()
+
 
 class TestSearchAll:
     def test_finds_matching_files(self, tmp_dir):
@@ -92,8 +136,28 @@ class TestSearchAll:
 
         results = vm.search_all("alice")
         assert len(results) == 1
-        assert results[0]["section"] == "people"
-        assert "alice.md" in results[0]["path"]
+        assert results[0].section == "people"
+        assert "alice.md" in results[0].path
+
+    def test_hits_support_key_access(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        (vm.people_dir / "alice.md").write_text("Works at Acme Corp\n")
+
+        hit = vm.search_all("acme")[0]
+        assert hit["section"] == hit.section == "people"
+        assert hit["snippets"] == ("Works at Acme Corp",)
+
+    def test_finds_files_in_nested_directories(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        nested = vm.projects_dir / "roshni" / "notes"
+        nested.mkdir(parents=True)
+        (nested / "design.md").write_text("Nested keyword here\n")
+        (nested / "diagram.png").write_bytes(b"keyword")
+
+        results = vm.search_all("keyword")
+        assert [r.path for r in results] == [os.path.join("projects", "roshni", "notes", "design.md")]
 
     def test_empty_query_returns_empty(self, tmp_dir):
         vm = VaultManager(tmp_dir)
@@ -113,3 +177,217 @@ class TestSearchAll:
             (vm.people_dir / f"person{i}.md").write_text(f"Person {i} is a keyword match\n")
         results = vm.search_all("keyword", limit=2)
         assert len(results) == 2
+
+    def test_non_positive_limit_returns_nothing(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        (vm.ideas_dir / "idea.md").write_text("keyword\n")
+        assert vm.search_all("keyword", limit=0) == []
+        assert vm.search_all("keyword other", limit=0) == []
+
+    def test_multi_term_ranks_by_distinct_terms(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        (vm.people_dir / "alice.md").write_text("Alice works on the robot\n")
+        (vm.ideas_dir / "robot.md").write_text("Build a robot butler\n")
+        (vm.projects_dir / "garden.md").write_text("Plant tomatoes\n")
+
+        results = vm.search_all("robot butler")
+        assert [r.path for r in results] == ["ideas/robot.md", "people/alice.md"]
+        assert "robot butler" in results[0].snippets[0]
+
+    def test_multi_term_counts_overlapping_terms(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        # projects/ is walked before ideas/, so a tie would keep toy.md first
+        (vm.projects_dir / "toy.md").write_text("Fix the robot\n")
+        (vm.ideas_dir / "lab.md").write_text("Visit the robotics lab\n")
+
+        assert [r.path for r in vm.search_all("robot robotics")] == ["ideas/lab.md", "projects/toy.md"]
+
+    def test_cold_index_reads_many_files(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        for i in range(20):
+            (vm.ideas_dir / f"idea{i}.md").write_text(f"Idea {i} mentions widgets\n")
+        (vm.ideas_dir / "binary.md").write_bytes(b"\xff\xfe widgets")
+
+        results = vm.search_all("widgets", limit=50)
+        assert sorted(r.path for r in results) == sorted(f"ideas/idea{i}.md" for i in range(20))
+
+    def test_index_persists_across_instances(self, tmp_dir, monkeypatch):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        (vm.people_dir / "alice.md").write_text("Alice works at Acme\n")
+        (vm.people_dir / "bob.md").write_text("Bob likes tea\n")
+        assert len(vm.search_all("acme")) == 1
+        assert vm._index.path.exists()
+        assert not vm._index.path.is_relative_to(vm.vault_path)
+
+        # A new instance re-indexes nothing and reads only the candidate file's text
+        read: list[str] = []
+        real_read = vault_module._read_text
+        monkeypatch.setattr(vault_module, "_read_text", lambda path: (read.append(path), real_read(path))[1])
+        fresh = VaultManager(tmp_dir)
+        assert len(fresh.search_all("acme")) == 1
+        assert fresh._index.generation == 0
+        assert read == [str(vm.people_dir / "alice.md")]
+
+    def test_index_snapshot_holds_no_note_text(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        (vm.people_dir / "alice.md").write_text("Alice's passport number is X1234\n")
+        vm.search_all("passport")
+
+        snapshot = vm._index.path.read_text()
+        assert "passport number" not in snapshot
+        assert "alice.md" in snapshot
+
+    def test_index_saves_are_throttled_and_flushed_on_close(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        (vm.people_dir / "alice.md").write_text("Alice works at Acme\n")
+        vm.search_all("acme")
+        saved = vm._index.path.read_text()
+
+        (vm.people_dir / "bob.md").write_text("Bob also joined Acme\n")
+        assert len(vm.search_all("acme")) == 2
+        assert vm._index.path.read_text() == saved  # within the save interval
+
+        vm.close()
+        assert "bob.md" in vm._index.path.read_text()
+
+    def test_malformed_index_is_a_cold_start(self, tmp_dir, tmp_path):
+        vm = VaultManager(tmp_dir, index_dir=tmp_path)
+        vm.scaffold()
+        (vm.people_dir / "alice.md").write_text("Alice works at Acme\n")
+        assert len(vm.search_all("acme")) == 1
+
+        for junk in (
+            "{not json",
+            '{"version": 4, "paths": ["x"], "files": [[1, "two"]], "postings": {}}',
+            '{"version": 4, "paths": [], "files": [], "postings": {"acme": [5]}}',
+            '{"version": 4, "paths": [], "files": []}',
+        ):
+            vm._index.path.write_text(junk)
+            fresh = VaultManager(tmp_dir, index_dir=tmp_path)
+            assert [r.path for r in fresh.search_all("acme")] == ["people/alice.md"]
+            assert fresh._index.generation == 1  # rebuilt from the files
+
+    def test_index_picks_up_changes_and_deletions(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        note = vm.ideas_dir / "note.md"
+        note.write_text("first draft\n")
+        assert len(vm.search_all("draft")) == 1
+
+        note.write_text("second version, much longer\n")
+        assert vm.search_all("draft") == []
+        assert len(vm.search_all("second")) == 1
+
+        note.unlink()
+        assert vm.search_all("second") == []
+
+    def test_repeated_query_served_from_cache_until_vault_changes(self, tmp_dir, monkeypatch):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        (vm.people_dir / "alice.md").write_text("Alice works at Acme\n")
+        first = vm.search_all("acme")
+
+        def _no_rescan(*args):
+            raise AssertionError("unexpected rescan")
+
+        with monkeypatch.context() as m:
+            m.setattr(vault_module, "_match_offsets", _no_rescan)
+            assert vm.search_all("ACME") == first
+
+        (vm.people_dir / "bob.md").write_text("Bob also joined Acme\n")
+        assert len(vm.search_all("acme")) == 2
+
+    def test_punctuated_query_prefilters_on_each_word(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        (vm.projects_dir / "a.md").write_text("Ship v2.0 next week\n")
+        (vm.projects_dir / "b.md").write_text("v2 and 0 apart\n")
+        (vm.projects_dir / "c.md").write_text("--- only dashes ---\n")
+
+        assert [r.path for r in vm.search_all("v2.0")] == ["projects/a.md"]
+        assert "projects/c.md" in [r.path for r in vm.search_all("---")]
+
+    def test_ignores_embedded_base64(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        (vm.ideas_dir / "pic.md").write_text("Diagram ![x](data:image/png;base64,QUJDxyzQUJD==) here\n")
+        assert vm.search_all("xyz") == []
+        results = vm.search_all("diagram")
+        assert "base64" not in results[0].snippets[0]
+
+    def test_word_index_keeps_substring_semantics(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        (vm.people_dir / "alice.md").write_text("Alice works at ACME-West\n")
+        (vm.people_dir / "bob.md").write_text("Bob likes tea\n")
+
+        assert [r.path for r in vm.search_all("cme")] == ["people/alice.md"]
+        assert [r.path for r in vm.search_all("acme-w")] == ["people/alice.md"]
+        assert [r.path for r in vm.search_all("alice west")] == ["people/alice.md"]
+
+    def test_concurrent_searches_while_vault_changes(self, tmp_dir):
+        vm = VaultManager(tmp_dir)
+        vm.scaffold()
+        for i in range(10):
+            (vm.ideas_dir / f"idea{i}.md").write_text(f"Idea {i} mentions widgets\n")
+        errors: list[BaseException] = []
+
+        def _search(n: int) -> None:
+            try:
+                for j in range(30):
+                    (vm.people_dir / f"p{n}-{j}.md").write_text(f"person{n}x{j} gadget{j}\n")
+                    vm.search_all(f"gadget{j}")
+                    vm.search_all("widgets idea")
+            except BaseException as e:
+                errors.append(e)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=_search, args=(n,)) for n in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+        assert len(vm.search_all("widgets", limit=50)) == 10
+
+
+class TestExtractSnippets:
+    def test_context_lines_around_match(self):
+        content = "one\ntwo\nthree key\nfour\nfive"
+        assert _extract_snippets(content, [content.index("key")]) == ("two\nthree key\nfour",)
+
+    def test_match_on_first_and_last_line(self):
+        content = "key first\nmiddle\nlast key"
+        offsets = [0, content.rindex("key")]
+        assert _extract_snippets(content, offsets) == ("key first\nmiddle", "middle\nlast key")
+
+    def test_one_snippet_per_line_and_max(self):
+        content = "key key\nkey\nkey\nkey"
+        offsets = [i for i in range(len(content)) if content.startswith("key", i)]
+        snippets = _extract_snippets(content, offsets, max_snippets=2)
+        assert snippets == ("key key\nkey", "key key\nkey\nkey")
+
+
+class TestMatchOffsets:
+    def test_ascii_fast_path_matches_regex(self):
+        content = "Acme\nwe like ACME and acme-west\n"
+        pattern = vault_module._term_matcher(("acme",))
+        assert list(_match_offsets(content, "acme", pattern)) == [m.start() for m in pattern.finditer(content)]
+
+    def test_non_ascii_text_uses_pattern(self):
+        content = "Café CAFÉ\ncafé"
+        pattern = vault_module._term_matcher(("café",))
+        assert list(_match_offsets(content, "café", pattern)) == [0, 5, 10]
+        assert list(_match_offsets("naïve Acme", "acme", vault_module._term_matcher(("acme",)))) == [6]
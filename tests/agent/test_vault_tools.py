@@ -1,7 +1,7 @@
 """Tests for vault tools — people, projects, ideas, search."""
 
 from roshni.agent.permissions import PermissionTier
-from roshni.agent.tools.vault_tools import create_vault_tools
+from roshni.agent.tools.vault_tools import _update_frontmatter_field, create_vault_tools
 from roshni.agent.vault import VaultManager
 
 
@@ -40,6 +40,26 @@ class TestCreateVaultTools:
         assert "save_project" not in names
         assert "save_idea" not in names
 
+    def test_keeps_interleaved_order(self, tmp_dir):
+        vm = _make_vault(tmp_dir)
+        names = [t.name for t in create_vault_tools(vm, tier=PermissionTier.INTERACT)]
+        assert names == [
+            "list_people",
+            "get_person",
+            "save_person",
+            "search_people",
+            "list_projects",
+            "get_project",
+            "save_project",
+            "list_ideas",
+            "get_idea",
+            "save_idea",
+            "search_ideas",
+            "search_vault_all",
+        ]
+        observe = [t.name for t in create_vault_tools(vm, tier=PermissionTier.OBSERVE)]
+        assert observe == [n for n in names if not n.startswith("save_")]
+
     def test_none_returns_empty(self, tmp_dir):
         vm = _make_vault(tmp_dir)
         tools = create_vault_tools(vm, tier=PermissionTier.NONE)
@@ -62,6 +82,12 @@ class TestPeopleTools:
         result = tools["get_person"].execute({"name": "alice-smith"})
         assert "Works at Acme" in result
 
+    def test_save_person_creates_missing_directory(self, tmp_dir):
+        vm = VaultManager(tmp_dir, agent_dir="fresh")  # not scaffolded
+        tools = {t.name: t for t in create_vault_tools(vm)}
+        assert "Saved" in tools["save_person"].execute({"name": "Nia", "notes": "First entry"})
+        assert "First entry" in tools["get_person"].execute({"name": "nia"})
+
     def test_save_person_with_tags(self, tmp_dir):
         vm = _make_vault(tmp_dir)
         tools = {t.name: t for t in create_vault_tools(vm)}
@@ -83,6 +109,20 @@ class TestPeopleTools:
         result = tools["search_people"].execute({"query": "Acme"})
         assert "dana" in result.lower()
 
+    def test_search_people_non_ascii_query(self, tmp_dir):
+        vm = _make_vault(tmp_dir)
+        tools = {t.name: t for t in create_vault_tools(vm)}
+        tools["save_person"].execute({"name": "Élodie", "notes": "Runs a Café downtown"})
+        assert "élodie" in tools["search_people"].execute({"query": "café"}).lower()
+        assert "No results" in tools["search_people"].execute({"query": "bistro"})
+
+    def test_search_people_ascii_query_in_non_ascii_note(self, tmp_dir):
+        vm = _make_vault(tmp_dir)
+        tools = {t.name: t for t in create_vault_tools(vm)}
+        tools["save_person"].execute({"name": "Élodie", "notes": "Met at the ACME Café"})
+        result = tools["search_people"].execute({"query": "Acme"})
+        assert "ACME Café" in result
+
     def test_get_person_not_found(self, tmp_dir):
         vm = _make_vault(tmp_dir)
         tools = {t.name: t for t in create_vault_tools(vm)}
@@ -125,6 +165,13 @@ class TestIdeaTools:
         result = tools["search_ideas"].execute({"query": "energy"})
         assert "solar" in result.lower()
 
+    def test_search_preview_centers_on_late_match(self, tmp_dir):
+        vm = _make_vault(tmp_dir)
+        tools = {t.name: t for t in create_vault_tools(vm)}
+        tools["save_idea"].execute({"title": "Long Note", "notes": "filler " * 100 + "Zeppelin at the end"})
+        result = tools["search_ideas"].execute({"query": "zeppelin"})
+        assert "Zeppelin" in result
+
 
 class TestSearchVaultAll:
     def test_cross_section_search(self, tmp_dir):
@@ -205,6 +252,73 @@ class TestAppendBehavior:
         assert "Initial concept" in result
         assert "Needs battery breakthrough" in result
 
+    def test_concurrent_appends_all_land(self, tmp_dir):
+        from concurrent.futures import ThreadPoolExecutor
+
+        vm = _make_vault(tmp_dir)
+        tools = {t.name: t for t in create_vault_tools(vm)}
+        tools["save_person"].execute({"name": "Grace", "notes": "Initial"})
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: tools["save_person"].execute({"name": "Grace", "notes": f"note-{i}"}), range(20)))
+
+        content = tools["get_person"].execute({"name": "grace"})
+        for i in range(20):
+            assert f"note-{i}" in content
+
+    def test_readers_never_see_a_partial_append(self, tmp_dir):
+        import threading
+
+        vm = _make_vault(tmp_dir)
+        tools = {t.name: t for t in create_vault_tools(vm)}
+        tools["save_person"].execute({"name": "Kim", "notes": "Initial"})
+        path = vm.people_dir / "kim.md"
+        done = threading.Event()
+        torn: list[str] = []
+
+        def _read() -> None:
+            while not done.is_set():
+                content = path.read_text()
+                if not (content.startswith("---\n") and content.endswith("\n")):
+                    torn.append(content)
+
+        reader = threading.Thread(target=_read)
+        reader.start()
+        try:
+            for i in range(50):
+                tools["save_person"].execute({"name": "Kim", "notes": f"note-{i}"})
+        finally:
+            done.set()
+            reader.join()
+
+        assert torn == []
+        assert "note-49" in path.read_text()
+
+    def test_append_matches_full_rewrite_layout(self, tmp_dir):
+        from datetime import datetime
+
+        vm = _make_vault(tmp_dir)
+        tools = {t.name: t for t in create_vault_tools(vm)}
+        path = vm.people_dir / "hana.md"
+        path.write_text('---\nname: "Hana"\nupdated: "2000-01-01 00:00"\n---\nBody text\n\n\n')
+        tools["save_person"].execute({"name": "Hana", "notes": "Next"})
+
+        content = path.read_text()
+        today = datetime.now().strftime("%Y-%m-%d")
+        assert content.startswith(f'---\nname: "Hana"\nupdated: "{today} ')
+        assert content.endswith(f"---\nBody text\n\n- {today}: Next\n")
+
+    def test_append_without_updated_field(self, tmp_dir):
+        vm = _make_vault(tmp_dir)
+        tools = {t.name: t for t in create_vault_tools(vm)}
+        path = vm.people_dir / "ivan.md"
+        path.write_text('---\nname: "Ivan"\n---\nBody')
+        tools["save_person"].execute({"name": "Ivan", "notes": "Later"})
+
+        content = path.read_text()
+        assert "updated:" in content.split("---")[1]
+        assert content.endswith(": Later\n")
+
 
 class TestPartialMatching:
     def test_partial_match_person(self, tmp_dir):
@@ -240,12 +354,40 @@ class TestPartialMatching:
         result = tools["get_person"].execute({"name": "bob"})
         assert "Just Bob" in result
 
+    def test_prefix_match_preferred_over_substring(self, tmp_dir):
+        vm = _make_vault(tmp_dir)
+        tools = {t.name: t for t in create_vault_tools(vm)}
+        tools["save_person"].execute({"name": "Anna Lee", "notes": "Substring hit"})
+        tools["save_person"].execute({"name": "Lee Park", "notes": "Prefix hit"})
+
+        result = tools["get_person"].execute({"name": "lee"})
+        assert "Prefix hit" in result
+
     def test_partial_match_not_found(self, tmp_dir):
         vm = _make_vault(tmp_dir)
         tools = {t.name: t for t in create_vault_tools(vm)}
         result = tools["get_person"].execute({"name": "zzzzz"})
         assert "Not found" in result
 
+    def test_partial_match_sees_externally_added_file(self, tmp_dir):
+        vm = _make_vault(tmp_dir)
+        tools = {t.name: t for t in create_vault_tools(vm)}
+        tools["save_person"].execute({"name": "Alice Smith", "notes": "Engineer"})
+        assert "Engineer" in tools["get_person"].execute({"name": "alice"})
+
+        (vm.people_dir / "bob-jones.md").write_text("---\nname: Bob\n---\nDesigner\n")
+        assert "Designer" in tools["get_person"].execute({"name": "bob"})
+
+    def test_partial_match_sees_file_added_inside_entry_subdirectory(self, tmp_dir):
+        vm = _make_vault(tmp_dir)
+        tools = {t.name: t for t in create_vault_tools(vm)}
+        (vm.people_dir / "carol-diaz").mkdir()
+        assert "Not found" in tools["get_person"].execute({"name": "carol"})
+
+        # Adding a file inside the subdirectory leaves the people/ mtime unchanged
+        (vm.people_dir / "carol-diaz" / "profile.md").write_text("---\nname: Carol\n---\nPilot\n")
+        assert "Pilot" in tools["get_person"].execute({"name": "carol"})
+
 
 class TestGetIdea:
     def test_get_idea_by_exact_slug(self, tmp_dir):
@@ -319,3 +461,22 @@ class TestListWithDates:
         result = tools["list_ideas"].execute({})
         assert "listed-idea" in result
         assert "updated" in result
+
+
+class TestUpdateFrontmatterField:
+    def test_replaces_existing_field(self):
+        content = '---\nname: "A"\nupdated: "old"\n---\nbody\n'
+        assert _update_frontmatter_field(content, "updated", "new") == '---\nname: "A"\nupdated: "new"\n---\nbody\n'
+
+    def test_inserts_missing_field_before_closing_fence(self):
+        content = '---\nname: "A"\n---\nbody\n'
+        assert _update_frontmatter_field(content, "updated", "new") == '---\nname: "A"\nupdated: "new"\n---\nbody\n'
+
+    def test_leaves_body_alone(self):
+        content = '---\nname: "A"\n---\nupdated: keep me\n'
+        result = _update_frontmatter_field(content, "updated", "new")
+        assert result.endswith("---\nupdated: keep me\n")
+        assert 'updated: "new"\n---' in result
+
+    def test_no_frontmatter_is_unchanged(self):
+        assert _update_frontmatter_field("just text\n", "updated", "new") == "just text\n"
@@ -1,9 +1,12 @@
 """Tests for FileWorkflowBackend — checkpointing, events, replay, conflicts."""
 
+import asyncio
 import json
+import shutil
 
 import pytest
 
+import roshni.agent.workflow.backend as backend_module
 from roshni.agent.workflow.backend import (
     FileWorkflowBackend,
     check_obsidian_conflict,
@@ -11,12 +14,15 @@ from roshni.agent.workflow.backend import (
     render_obsidian,
 )
 from roshni.agent.workflow.models import (
+    JournalEntry,
     Phase,
     PhaseEntry,
+    PhaseStatus,
     Project,
     ProjectStatus,
     TaskSpec,
     WorkflowEvent,
+    compute_plan_hash,
 )
 
 
@@ -66,6 +72,91 @@ class TestEventRecording:
         seqs = [json.loads(line)["seq"] for line in lines]
         assert seqs == [1, 2, 3, 4, 5]
 
+    async def test_new_backend_continues_seq_from_log_tail(self, tmp_path, backend, sample_project):
+        pid = sample_project.id
+        for _ in range(3):
+            evt = backend.create_event(pid, "test.event", "test", {"blob": "x" * 3000})
+            await backend.record_event(pid, evt)
+        evt = backend.create_event(pid, "test.event", "test", {"blob": "y" * 9000})
+        await backend.record_event(pid, evt)
+        with open(backend._project_dir(pid) / "events.ndjson", "ab") as f:
+            f.write(b'{"seq": 99, "type": "torn')
+
+        fresh = FileWorkflowBackend(tmp_path / "projects")
+        assert fresh.create_event(pid, "test.event", "test").seq == 5
+        assert FileWorkflowBackend(tmp_path / "projects").create_event("proj-empty", "x", "test").seq == 1
+
+    async def test_new_backend_seq_survives_out_of_order_log(self, tmp_path, sample_project):
+        pid = sample_project.id
+        events_path = tmp_path / "projects" / pid / "events.ndjson"
+        events_path.parent.mkdir(parents=True)
+
+        # Out of order within the tail: the max wins, not the last line
+        events_path.write_text("".join(json.dumps({"seq": s, "type": "x"}) + "\n" for s in (1, 3, 2)))
+        assert FileWorkflowBackend(tmp_path / "projects").create_event(pid, "x", "test").seq == 4
+
+        # Out of order in the tail with a higher seq further back: fall back to a full scan
+        lines = [{"seq": 50, "type": "x", "payload": {"blob": "z" * 5000}}, {"seq": 7, "type": "x"}, {"seq": 6}]
+        events_path.write_text("".join(json.dumps(e) + "\n" for e in lines))
+        assert FileWorkflowBackend(tmp_path / "projects").create_event(pid, "x", "test").seq == 51
+
+    async def test_event_fsyncs_are_grouped_and_forced_by_checkpoint(self, backend, sample_project, monkeypatch):
+        synced: list[int] = []
+        real_sync = backend_module._datasync
+        monkeypatch.setattr(backend_module, "_datasync", lambda fd: (synced.append(fd), real_sync(fd)))
+
+        for _ in range(20):
+            evt = backend.create_event(sample_project.id, "test.event", "test")
+            await backend.record_event(sample_project.id, evt)
+        events_path = backend._project_dir(sample_project.id) / "events.ndjson"
+        assert len(events_path.read_text().splitlines()) == 20  # visible before any fsync
+        assert synced == []
+
+        await backend.checkpoint(sample_project)
+        assert len(synced) >= 1
+        event_syncs = len(synced)
+        await asyncio.sleep(0.05)  # pending group-commit timer finds nothing left to sync
+        assert len(synced) == event_syncs
+        backend.close()
+
+    def test_fsync_rescheduled_after_owning_loop_closes(self, tmp_path, sample_project, monkeypatch):
+        synced: list[int] = []
+        monkeypatch.setattr(backend_module, "_datasync", synced.append)
+        backend = FileWorkflowBackend(tmp_path / "projects")
+        pid = sample_project.id
+
+        async def _record() -> None:
+            await backend.record_event(pid, backend.create_event(pid, "test.event", "test"))
+
+        asyncio.run(_record())  # loop closes before its fsync timer fires
+        assert synced == []
+
+        async def _record_and_wait() -> None:
+            await _record()
+            await asyncio.sleep(0.05)
+
+        asyncio.run(_record_and_wait())
+        assert synced == [backend._event_fds[pid]]
+        backend.close()
+
+    async def test_context_exit_syncs_and_closes_event_fds(self, tmp_path, sample_project):
+        async with FileWorkflowBackend(tmp_path / "projects") as backend:
+            await backend.record_event(sample_project.id, backend.create_event(sample_project.id, "test.event", "test"))
+            assert sample_project.id in backend._event_fds
+        assert backend._event_fds == {}
+        assert backend._unsynced == {}
+
+    async def test_events_reopen_after_workspace_removed(self, backend, sample_project):
+        pid = sample_project.id
+        await backend.record_event(pid, backend.create_event(pid, "test.event", "test"))
+        shutil.rmtree(backend._project_dir(pid))
+
+        await backend.record_event(pid, backend.create_event(pid, "test.event", "test"))
+        lines = (backend._project_dir(pid) / "events.ndjson").read_text().splitlines()
+        assert [json.loads(line)["seq"] for line in lines] == [2]
+        backend.close()
+        backend.close()
+
 
 class TestCheckpointResume:
     async def test_checkpoint_roundtrip(self, backend, sample_project):
@@ -81,6 +172,58 @@ class TestCheckpointResume:
         assert loaded.goal == sample_project.goal
         assert loaded.budget.cost_used_usd == pytest.approx(0.5)
 
+    async def test_checkpoint_journal_tracks_appends_and_replacement(self, backend, sample_project):
+        checkpoint_path = backend._project_dir(sample_project.id) / "checkpoint.json"
+        sample_project.journal.append(JournalEntry("2026-01-01T00:00:00", "user", "note", "first"))
+        await backend.checkpoint(sample_project)
+        sample_project.journal.append(JournalEntry("2026-01-01T00:01:00", "user", "note", "second", {"k": "ü"}))
+        await backend.checkpoint(sample_project)
+        # The second checkpoint only appends the new entry as a delta
+        assert [j["content"] for j in json.loads(checkpoint_path.read_bytes())["journal"]] == ["first"]
+        loaded = await backend.resume(sample_project.id)
+        assert [j.content for j in loaded.journal] == ["first", "second"]
+        assert loaded.journal[1].metadata == {"k": "ü"}
+
+        sample_project.journal = [JournalEntry("2026-01-02T00:00:00", "system", "reset", "only")]
+        await backend.checkpoint(sample_project)
+        loaded = await backend.resume(sample_project.id)
+        assert [j.content for j in loaded.journal] == ["only"]
+        assert loaded.goal == sample_project.goal
+
+    async def test_checkpoint_deltas_survive_restart_and_compact(self, tmp_path, backend, sample_project):
+        project_dir = backend._project_dir(sample_project.id)
+        delta_path = project_dir / "checkpoint.delta.ndjson"
+        await backend.checkpoint(sample_project)
+        sample_project.tags = ["changed"]
+        sample_project.status = ProjectStatus.EXECUTING
+        await backend.checkpoint(sample_project)
+        assert len(delta_path.read_text().splitlines()) == 1
+        assert '"goal"' not in delta_path.read_text()
+
+        fresh = FileWorkflowBackend(tmp_path / "projects", tmp_path / "obsidian")
+        loaded = await fresh.resume(sample_project.id)
+        assert loaded.tags == ["changed"]
+        assert loaded.status == ProjectStatus.EXECUTING
+
+        # A new process starts from a full snapshot and drops the old deltas
+        await fresh.checkpoint(loaded)
+        assert not delta_path.exists()
+
+        for i in range(40):
+            loaded.tags = [f"t{i}"]
+            await fresh.checkpoint(loaded)
+        assert len(delta_path.read_text().splitlines()) < 40
+        assert (await FileWorkflowBackend(tmp_path / "projects").resume(sample_project.id)).tags == ["t39"]
+
+    async def test_stale_and_torn_deltas_are_ignored(self, backend, sample_project):
+        await backend.checkpoint(sample_project)
+        delta_path = backend._project_dir(sample_project.id) / "checkpoint.delta.ndjson"
+        with open(delta_path, "ab") as f:
+            f.write(b'{"base":"old-snapshot","set":{"goal":"stale"}}\n{"base":')
+
+        loaded = await backend.resume(sample_project.id)
+        assert loaded.goal == sample_project.goal
+
     async def test_resume_from_events_only(self, backend, sample_project):
         """If checkpoint is missing, rebuild from events."""
         pid = sample_project.id
@@ -173,6 +316,45 @@ class TestEventReplayDeterminism:
         project = await backend.resume(pid)
         assert project.status == ProjectStatus.EXECUTING
 
+    async def test_replay_applies_phase_budget_and_plan_events(self, backend, sample_project):
+        pid = sample_project.id
+        sample_project.last_event_seq = 0
+        await backend.checkpoint(sample_project)
+
+        for evt_type, payload in [
+            ("phase.started", {"phase_id": "phase-1"}),
+            ("budget.recorded_call", {"cost_usd": 0.25}),
+            ("task.dispatched", {"phase_id": "phase-1", "task_id": "task-001"}),
+            ("phase.completed", {"phase_id": "phase-1"}),
+            ("phase.failed", {"phase_id": "no-such-phase"}),
+            ("plan.written", {"plan_hash": "abc123"}),
+        ]:
+            await backend.record_event(pid, backend.create_event(pid, evt_type, "test", payload))
+
+        project = await backend.resume(pid)
+        phase = project.phases[0]
+        assert phase.status == PhaseStatus.COMPLETED
+        assert phase.started and phase.completed
+        assert project.budget.llm_calls_used == 1
+        assert project.budget.cost_used_usd == pytest.approx(0.25)
+        assert project.plan_hash == "abc123"
+        assert project.last_event_seq == 6
+
+    async def test_out_of_order_log_is_sorted_before_replay(self, backend):
+        pid = "proj-merged-log"
+        lines = [
+            {"seq": 1, "type": "project.created", "payload": {"goal": "merged"}},
+            {"seq": 3, "type": "project.transitioned", "payload": {"to": "executing"}},
+            {"seq": 2, "type": "project.transitioned", "payload": {"to": "awaiting_approval"}},
+        ]
+        events_path = backend._project_dir(pid) / "events.ndjson"
+        events_path.parent.mkdir(parents=True)
+        events_path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+        project = await backend.resume(pid)
+        assert project.status == ProjectStatus.EXECUTING
+        assert project.last_event_seq == 3
+
 
 class TestResumeFuzz:
     """Test resume with partial/corrupt files."""
@@ -204,6 +386,17 @@ class TestResumeFuzz:
         project = await backend.resume(pid)
         assert project.goal == "rebuilt"
 
+    async def test_malformed_event_lines_are_skipped(self, backend):
+        pid = "proj-torn-log"
+        evt = backend.create_event(pid, "project.created", "system", {"goal": "café plan"})
+        await backend.record_event(pid, evt)
+        with open(backend._project_dir(pid) / "events.ndjson", "ab") as f:
+            f.write(b'{"seq": 2, "type": "phase.sta\n\xff\xfe\n')
+
+        project = await backend.resume(pid)
+        assert project.goal == "café plan"
+        assert project.last_event_seq == 1
+
     async def test_no_checkpoint_no_events(self, backend):
         """No checkpoint and no events should raise."""
         with pytest.raises(ValueError, match="No checkpoint or events"):
@@ -240,6 +433,21 @@ class TestObsidianConflict:
         assert result is not None
         assert "Plan hash changed" in result
 
+    def test_conflict_check_reads_only_frontmatter(self, tmp_path):
+        obs_path = tmp_path / "test.md"
+        # A body that isn't valid UTF-8 is never decoded
+        obs_path.write_bytes(b"---\nplan_hash: different_hash\n---\n" + b"\xff" * 10000)
+        assert "Plan hash changed" in check_obsidian_conflict(obs_path, "abc123", "2020-01-01T00:00:00")
+
+        long_fm = "---\nnotes: " + "x" * 5000 + "\nplan_hash: different_hash\n---\nbody"
+        obs_path.write_text(long_fm)
+        assert "Plan hash changed" in check_obsidian_conflict(obs_path, "abc123", "2020-01-01T00:00:00")
+
+    def test_unparseable_last_update_no_conflict(self, tmp_path):
+        obs_path = tmp_path / "test.md"
+        obs_path.write_text("---\nplan_hash: different_hash\n---\n")
+        assert check_obsidian_conflict(obs_path, "abc123", "not-a-timestamp") is None
+
     def test_missing_file_no_conflict(self, tmp_path):
         obs_path = tmp_path / "nonexistent.md"
         result = check_obsidian_conflict(obs_path, "abc123", "2026-01-01T00:00:00")
@@ -260,6 +468,36 @@ class TestObsidianRendering:
         assert fm["status"] == "executing"
         assert fm["plan_hash"] == "abc"
 
+    async def test_unchanged_note_not_rewritten(self, backend, sample_project):
+        sample_project.obsidian_file = "Projects/test.md"
+        obs_path = backend._obsidian_dir / sample_project.obsidian_file
+        await backend.checkpoint(sample_project)
+        first = obs_path.stat()
+
+        await backend.checkpoint(sample_project)
+        assert (obs_path.stat().st_ino, obs_path.stat().st_mtime_ns) == (first.st_ino, first.st_mtime_ns)
+
+        sample_project.phases[0].status = PhaseStatus.COMPLETED
+        await backend.checkpoint(sample_project)
+        assert obs_path.stat().st_ino != first.st_ino
+        assert "[x]" in obs_path.read_text()
+
+    async def test_deleted_note_rewritten(self, backend, sample_project):
+        sample_project.obsidian_file = "Projects/test.md"
+        obs_path = backend._obsidian_dir / sample_project.obsidian_file
+        await backend.checkpoint(sample_project)
+        obs_path.unlink()
+
+        await backend.checkpoint(sample_project)
+        assert sample_project.goal in obs_path.read_text()
+
+
+class TestSavePlan:
+    async def test_sets_plan_hash(self, backend, sample_project):
+        await backend.save_plan(sample_project)
+        assert (backend._project_dir(sample_project.id) / "plan.json").exists()
+        assert sample_project.plan_hash == compute_plan_hash(sample_project)
+
 
 class TestLLMCallRecording:
     async def test_record_llm_call(self, backend, sample_project):
@@ -275,3 +513,31 @@ class TestLLMCallRecording:
         assert llm_dir.exists()
         files = list(llm_dir.glob("*.json"))
         assert len(files) == 1
+
+    async def test_workspace_dirs_created_once_until_forgotten(self, backend, sample_project, monkeypatch):
+        pid = sample_project.id
+        await backend.record_llm_call(pid, {"id": "call-1"})
+
+        def _no_mkdir(*args, **kwargs):
+            raise AssertionError("unexpected mkdir")
+
+        with monkeypatch.context() as m:
+            m.setattr(type(backend._project_dir(pid)), "mkdir", _no_mkdir)
+            await backend.record_llm_call(pid, {"id": "call-2"})
+
+        backend.forget_workspace(pid)
+        shutil.rmtree(backend._project_dir(pid))
+        await backend.record_llm_call(pid, {"id": "call-3"})
+        assert len(list((backend._project_dir(pid) / "llm-calls").glob("*.json"))) == 1
+
+
+class TestListProjectIds:
+    async def test_lists_dirs_with_checkpoint_or_events(self, backend, sample_project, tmp_path):
+        assert backend.list_project_ids() == []
+
+        await backend.checkpoint(sample_project)
+        await backend.record_event("proj-b", backend.create_event("proj-b", "project.created", "system"))
+        (tmp_path / "projects" / "empty-dir").mkdir()
+        (tmp_path / "projects" / "stray.txt").write_text("x")
+
+        assert backend.list_project_ids() == sorted([sample_project.id, "proj-b"])
@@ -79,6 +79,10 @@ class TestValidTransitions:
         with pytest.raises(ValueError, match="Invalid transition"):
             validate_transition(ProjectStatus.PLANNING, ProjectStatus.DONE)
 
+    def test_invalid_transition_lists_allowed_targets(self):
+        with pytest.raises(ValueError, match=r"Allowed: awaiting_approval, cancelled, failed$"):
+            validate_transition(ProjectStatus.PLANNING, ProjectStatus.DONE)
+
 
 class TestBudget:
     def test_not_exhausted_initially(self):
@@ -101,12 +105,28 @@ class TestBudget:
         b = Budget(max_wall_seconds=10.0, wall_seconds_used=10.0)
         assert b.exhausted
 
+    def test_record_several_calls_at_once(self):
+        b = Budget(max_llm_calls=3)
+        b.record_call(0.3, calls=3)
+        assert b.llm_calls_used == 3
+        assert b.cost_used_usd == pytest.approx(0.3)
+        assert b.exhausted
+
     def test_remaining_fraction(self):
         b = Budget(max_cost_usd=10.0, max_llm_calls=100)
         b.record_call(5.0)
         # Cost: 50% remaining, calls: 99% remaining -> min = 50%
         assert b.remaining_fraction() == pytest.approx(0.5, abs=0.01)
 
+    def test_remaining_fraction_without_limits(self):
+        b = Budget(max_cost_usd=0.0, max_llm_calls=0, max_wall_seconds=0.0)
+        assert b.remaining_fraction() == 1.0
+
+    def test_remaining_fraction_floors_at_zero(self):
+        b = Budget(max_cost_usd=1.0)
+        b.record_call(2.0)
+        assert b.remaining_fraction() == 0.0
+
     def test_record_call_thread_safe(self):
         b = Budget(max_cost_usd=1000.0, max_llm_calls=10000)
         errors = []
@@ -179,6 +199,37 @@ class TestWorkflowEvent:
 
 
 class TestProjectSerialization:
+    def test_from_dict_restores_status_enums(self):
+        data = project_to_dict(Project(id="p", goal="g", status=ProjectStatus.PAUSED, phases=[Phase(id="a", name="A")]))
+        data["phases"][0]["status"] = "completed"
+        project = project_from_dict(data)
+        assert project.status is ProjectStatus.PAUSED
+        assert project.phases[0].status is PhaseStatus.COMPLETED
+
+    def test_from_dict_rejects_unknown_status(self):
+        with pytest.raises(ValueError):
+            project_from_dict({"id": "p", "goal": "g", "status": "bogus"})
+
+    def test_from_dict_interns_ids(self):
+        import json
+
+        project = Project(
+            id="p",
+            goal="g",
+            phases=[Phase(id="phase-1", name="P1", tasks=[TaskSpec(id="task-001", description="d")])],
+        )
+        raw = json.dumps(project_to_dict(project))
+        a, b = project_from_dict(json.loads(raw)), project_from_dict(json.loads(raw))
+        assert a.phases[0].id is b.phases[0].id
+        assert a.phases[0].tasks[0].id is b.phases[0].tasks[0].id
+
+    def test_statuses_serialize_as_plain_strings(self):
+        project = Project(id="p", goal="g", status=ProjectStatus.EXECUTING, phases=[Phase(id="p1", name="P1")])
+        project.phases[0].status = "active"  # type: ignore[assignment]
+        data = project_to_dict(project)
+        assert type(data["status"]) is str and data["status"] == "executing"
+        assert type(data["phases"][0]["status"]) is str and data["phases"][0]["status"] == "active"
+
     def test_roundtrip(self):
         project = Project(
             id="proj-20260215-001",
@@ -230,6 +281,22 @@ class TestProjectSerialization:
         )
         assert compute_plan_hash(p1) != compute_plan_hash(p2)
 
+    def test_plan_hash_value_is_stable_across_releases(self):
+        # Stored in checkpoints and Obsidian frontmatter; a different encoding would flag every plan as edited
+        project = Project(
+            id="p",
+            goal="g",
+            phases=[
+                Phase(
+                    id="phase-1",
+                    name="Ré",
+                    tasks=[TaskSpec(id="task-001", description="Do", allowed_tools=["x"])],
+                )
+            ],
+            terminal_conditions=[TerminalCondition(description="d", type="phase_count", params={"n": 1})],
+        )
+        assert compute_plan_hash(project) == "c9e6b5efdd0a66fa"
+
 
 @pytest.mark.smoke
 class TestSmoke:
@@ -247,3 +314,21 @@ class TestSmoke:
     def test_transitions_map_complete(self):
         for status in ProjectStatus:
             assert status in VALID_TRANSITIONS
+
+    def test_models_reject_stray_attributes(self):
+        p = Project(id="test-001", goal="Test goal")
+        with pytest.raises(AttributeError):
+            p.not_a_field = 1  # type: ignore[attr-defined]
+
+
+class TestNowIso:
+    def test_matches_datetime_isoformat(self):
+        from datetime import datetime
+
+        from roshni.agent.workflow.models import _now_iso
+
+        before = datetime.now().replace(microsecond=0)
+        stamp = _now_iso()
+        after = datetime.now().replace(microsecond=0)
+        assert before <= datetime.fromisoformat(stamp) <= after
+        assert stamp == datetime.fromisoformat(stamp).isoformat(timespec="seconds")
@@ -5,6 +5,7 @@ WorkerPool.spawn_worker() to return controlled WorkerResults.
 Uses real ProjectStore + FileWorkflowBackend with tmp_path.
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,12 +15,15 @@ from roshni.agent.workflow.backend import FileWorkflowBackend
 from roshni.agent.workflow.models import (
     Artifact,
     Budget,
+    JournalEntry,
+    Phase,
     PhaseStatus,
+    Project,
     ProjectStatus,
     TaskSpec,
     TerminalCondition,
 )
-from roshni.agent.workflow.orchestrator import Orchestrator
+from roshni.agent.workflow.orchestrator import _REVIEW_SHARD_SIZE, Orchestrator, _strip_fence
 from roshni.agent.workflow.store import ProjectStore
 from roshni.agent.workflow.worker import WorkerPool, WorkerResult
 
@@ -115,6 +119,22 @@ def orchestrator(mock_config, mock_secrets, store, backend, send_fn):
     )
 
 
+# ---------------------------------------------------------------------------
+# _strip_fence
+# ---------------------------------------------------------------------------
+
+
+class TestStripFence:
+    def test_plain_text_unchanged(self):
+        assert _strip_fence('  {"a": 1}\n') == '{"a": 1}'
+
+    def test_fenced_with_language(self):
+        assert _strip_fence('```json\n{"a": 1}\n```\n') == '{"a": 1}'
+
+    def test_fenced_without_closing(self):
+        assert _strip_fence('```\n{"a": 1}') == '{"a": 1}'
+
+
 # ---------------------------------------------------------------------------
 # start_project
 # ---------------------------------------------------------------------------
@@ -309,6 +329,21 @@ class TestApproveAndExecute:
         assert updated.status == ProjectStatus.PAUSED
         assert any("budget" in j.content.lower() for j in updated.journal)
 
+    @patch("roshni.agent.default.DefaultAgent")
+    async def test_budget_warning_names_most_severe_threshold(self, MockAgent, orchestrator, store):
+        MockAgent.return_value.invoke = AsyncMock(return_value=GOOD_PLAN_JSON)
+
+        project = await orchestrator.start_project("Warn test", budget=Budget(max_llm_calls=100))
+        project.budget.record_call(0.0, calls=90)  # 10% left
+        await orchestrator._store.update(project)
+
+        await orchestrator.approve_and_execute(project.id)
+
+        events_path = store.workspace_path(project.id) / "events.ndjson"
+        events = [json.loads(line) for line in events_path.read_text().splitlines()]
+        thresholds = [e["payload"]["threshold"] for e in events if e["type"] == "budget.warning"]
+        assert thresholds and thresholds[0] == "80%"
+
     @patch("roshni.agent.default.DefaultAgent")
     async def test_skips_completed_phases(self, MockAgent, orchestrator):
         MockAgent.return_value.invoke = AsyncMock(return_value=GOOD_PLAN_JSON)
@@ -365,6 +400,75 @@ class TestApproveAndExecute:
 # ---------------------------------------------------------------------------
 
 
+class TestPhaseTasks:
+    async def test_independent_tasks_run_concurrently(self, orchestrator):
+        phase = Phase(id="phase-1", name="P", tasks=[TaskSpec(id=f"task-{i:03d}", description="t") for i in range(3)])
+        project = Project(id="proj-1", goal="g", status=ProjectStatus.EXECUTING, phases=[phase])
+        in_flight = peak = 0
+
+        async def worker(proj, ph, task, **kw):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _make_worker_result(task, success=task.id != "task-001", error="Boom")
+
+        orchestrator._worker_pool.spawn_worker = AsyncMock(side_effect=worker)
+
+        assert await orchestrator._execute_phase_tasks(project, phase) is False
+        assert peak == 3
+        assert [j.content for j in project.journal] == ["Task task-001 failed: Boom"]
+
+    async def test_failure_withdraws_queued_tasks_and_awaits_running_ones(self, orchestrator):
+        phase = Phase(
+            id="phase-1",
+            name="P",
+            tasks=[TaskSpec(id=f"task-{i:03d}", description="t", max_attempts=2) for i in range(3)],
+        )
+        project = Project(id="proj-1", goal="g", status=ProjectStatus.EXECUTING, phases=[phase])
+        finished = []
+
+        async def worker(proj, ph, task, *, abort, **kw):
+            if task.id == "task-000":
+                return _make_worker_result(task, success=False, error="Boom")
+            if task.id == "task-001":  # already running: finishes and is recorded
+                await asyncio.sleep(0.02)
+                finished.append(task.id)
+                return _make_worker_result(task)
+            await asyncio.sleep(0.01)  # still queued for a worker slot when the phase fails
+            assert abort.is_set()
+            return None  # withdrawn, as the pool does
+
+        orchestrator._worker_pool.spawn_worker = AsyncMock(side_effect=worker)
+
+        assert await orchestrator._execute_phase_tasks(project, phase) is False
+        assert finished == ["task-001"]
+        # task-000 uses its retry before failing the phase; withdrawn task-002 is not retried
+        spawned = [c.args[2].id for c in orchestrator._worker_pool.spawn_worker.await_args_list]
+        assert spawned.count("task-000") == 2
+        assert spawned.count("task-002") == 1
+        # Only the real failure is journaled; the withdrawn task never ran
+        assert [j.content for j in project.journal] == ["Task task-000 failed: Boom"]
+
+    async def test_dependent_tasks_run_in_order_and_stop_on_failure(self, orchestrator):
+        phase = Phase(
+            id="phase-1",
+            name="P",
+            tasks=[
+                TaskSpec(id="task-001", description="a"),
+                TaskSpec(id="task-002", description="b", depends_on=["task-001"]),
+            ],
+        )
+        project = Project(id="proj-1", goal="g", status=ProjectStatus.EXECUTING, phases=[phase])
+        orchestrator._worker_pool.spawn_worker = AsyncMock(
+            side_effect=lambda proj, ph, task, **kw: _make_worker_result(task, success=False, error="Boom")
+        )
+
+        assert await orchestrator._execute_phase_tasks(project, phase) is False
+        assert [c.args[2].id for c in orchestrator._worker_pool.spawn_worker.call_args_list] == ["task-001"]
+
+
 class TestTerminalConditions:
     @patch("roshni.agent.default.DefaultAgent")
     async def test_no_conditions_means_done(self, MockAgent, orchestrator):
@@ -805,3 +909,79 @@ class TestReviewProjects:
 
         result = await orchestrator.review_projects(query="nonexistent")
         assert "No projects matching" in result
+
+    @patch("roshni.agent.default.DefaultAgent")
+    async def test_review_shards_many_projects(self, MockAgent, orchestrator, store, monkeypatch):
+        """Large reviews go out as concurrent shards plus one merge prompt; failed shards are named."""
+        projects = [Project(id=f"proj-{i:03d}", goal=f"Goal {i}") for i in range(_REVIEW_SHARD_SIZE * 2 + 1)]
+        monkeypatch.setattr(store, "list_projects", AsyncMock(return_value=projects))
+        prompts = []
+
+        async def mock_invoke(prompt, **kw):
+            prompts.append(prompt)
+            if "proj-000" in prompt and "Partial reviews" not in prompt:
+                raise RuntimeError("LLM down")
+            return f"review {len(prompts)}"
+
+        MockAgent.return_value.invoke = AsyncMock(side_effect=mock_invoke)
+
+        result = await orchestrator.review_projects()
+
+        assert len(prompts) == 4  # three shards + merge
+        assert all(f"proj-{i:03d}" in "".join(prompts[:3]) for i in range(len(projects)))
+        merge = prompts[-1]
+        assert "Partial reviews" in merge
+        assert merge.count("### Part") == 2
+        skipped = ", ".join(f"proj-{i:03d} (Goal {i})" for i in range(_REVIEW_SHARD_SIZE))
+        assert f"Not reviewed (review failed): {skipped}" in merge
+        assert result == f"review 4\n\nReview unavailable for: {skipped}"
+
+    @patch("roshni.agent.default.DefaultAgent")
+    async def test_review_query_matches_phase_names_and_tags(self, MockAgent, orchestrator, store, monkeypatch):
+        projects = [
+            Project(id="proj-a", goal="Alpha", phases=[Phase(id="phase-1", name="Sleep Research")]),
+            Project(id="proj-b", goal="Beta", tags=["Fitness"]),
+            Project(id="proj-c", goal="Gamma", tags=["sleep"]),
+        ]
+        monkeypatch.setattr(store, "list_projects", AsyncMock(return_value=projects))
+        MockAgent.return_value.invoke = AsyncMock(return_value="ok")
+
+        await orchestrator.review_projects(query="SLEEP")
+        prompt = MockAgent.return_value.invoke.call_args.args[0]
+        assert "proj-a" in prompt and "proj-c" in prompt and "proj-b" not in prompt
+
+        await orchestrator.review_projects(query="fitness")
+        assert "proj-b" in MockAgent.return_value.invoke.call_args.args[0]
+
+        # Matches may not run across field boundaries
+        assert (
+            await orchestrator.review_projects(query="alphasleep")
+            == "No projects matching query='alphasleep' tags=None."
+        )
+
+    @patch("roshni.agent.default.DefaultAgent")
+    async def test_review_summary_layout(self, MockAgent, orchestrator, store, monkeypatch):
+        project = Project(
+            id="proj-a",
+            goal="Alpha",
+            tags=["x"],
+            phases=[Phase(id="phase-1", name="One", status=PhaseStatus.COMPLETED), Phase(id="phase-2", name="Two")],
+            artifacts=[Artifact(name="notes.md", path="notes.md")],
+            terminal_conditions=[TerminalCondition(description="Ship it", type="llm_eval")],
+        )
+        project.journal.append(JournalEntry(timestamp="t", actor="orchestrator", action="note", content="hello"))
+        monkeypatch.setattr(store, "list_projects", AsyncMock(return_value=[project]))
+        MockAgent.return_value.invoke = AsyncMock(return_value="ok")
+
+        await orchestrator.review_projects()
+        prompt = MockAgent.return_value.invoke.call_args.args[0]
+        assert (
+            "### proj-a: Alpha\n"
+            "Status: planning | Tags: x\n"
+            "Phases: 1/2 completed\n"
+            "Artifacts: notes.md\n"
+            "Recent activity:\n"
+            "  - [orchestrator] note: hello\n"
+            "Unmet conditions:\n"
+            "  - Ship it\n"
+        ) in prompt
@@ -1,9 +1,13 @@
 """Tests for WorkerPool — tool allowlist, budget enforcement."""
 
+import asyncio
+from unittest.mock import MagicMock
+
 import pytest
 
-from roshni.agent.workflow.models import Budget, TaskSpec
-from roshni.agent.workflow.worker import ToolPolicyViolation, WorkerResult, _filter_tools_by_allowlist
+from roshni.agent.workflow.backend import FileWorkflowBackend
+from roshni.agent.workflow.models import Budget, Phase, Project, ProjectStatus, TaskSpec
+from roshni.agent.workflow.worker import ToolPolicyViolation, WorkerPool, WorkerResult, _filter_tools_by_allowlist
 
 
 class MockToolDefinition:
@@ -75,6 +79,41 @@ class TestBudgetEnforcement:
         budget.record_call(0.01)
         assert budget.exhausted
 
+    async def test_pause_while_queued_blocks_spawn(self, tmp_path):
+        """A task waiting for a slot re-checks project status once it gets one."""
+        pool = WorkerPool(
+            MagicMock(), MagicMock(), [], MagicMock(), FileWorkflowBackend(tmp_path / "projects"), max_concurrent=1
+        )
+        project = Project(id="proj-1", goal="g", status=ProjectStatus.EXECUTING)
+        phase = Phase(id="phase-1", name="P")
+        task = TaskSpec(id="task-001", description="t")
+
+        async with pool._semaphore:
+            queued = asyncio.create_task(pool.spawn_worker(project, phase, task))
+            await asyncio.sleep(0)
+            project.status = ProjectStatus.PAUSED
+        result = await queued
+
+        assert not result.success
+        assert "paused" in result.error
+        assert not (tmp_path / "projects" / "proj-1" / "events.ndjson").exists()
+
+    async def test_abort_while_queued_withdraws_task(self, tmp_path):
+        backend = FileWorkflowBackend(tmp_path / "projects")
+        pool = WorkerPool(MagicMock(), MagicMock(), [], MagicMock(), backend, max_concurrent=1)
+        project = Project(id="proj-1", goal="g", status=ProjectStatus.EXECUTING)
+        task = TaskSpec(id="task-001", description="t")
+        abort = asyncio.Event()
+
+        async with pool._semaphore:
+            queued = asyncio.create_task(pool.spawn_worker(project, Phase(id="phase-1", name="P"), task, abort=abort))
+            await asyncio.sleep(0)
+            abort.set()
+        # Withdrawn before it started: no result, and nothing dispatched or failed in the event log
+        assert await queued is None
+        assert not (tmp_path / "projects" / "proj-1" / "events.ndjson").exists()
+        backend.close()
+
 
 class TestToolPolicyViolation:
     def test_exception(self):